@@ -9,13 +9,59 @@ When an anomaly or crash is detected, this module:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import math
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Iterable
+from urllib.parse import urlparse
 
 from agent.config import DD_API_KEY, DD_APP_KEY, DD_SITE, DD_MOCK_SERVER, AGENT_ENV, KEY_SLIS
 from agent.observability import track_dd_query, logger
 
+# SLIs that anomaly detection checks, resolved once from config
+_ANOMALY_SLIS = tuple(sli for sli in KEY_SLIS if sli in ("crash_rate", "error_rate"))
+
+# Worker pool for concurrent per-SLI metric queries (I/O bound)
+_SLI_QUERY_WORKERS = 8
+_SLI_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_SLI_QUERY_WORKERS,
+    thread_name_prefix="dd-sli-query",
+)
+
+# 7-day baselines move on the order of hours; reuse them across polls.
+# (service, sli) -> (expires_at, baseline_avg, baseline_std)
+_BASELINE_TTL_S = 900
+_BASELINE_CACHE_MAX = 1024
+_BASELINE_CACHE: dict[tuple[str, str], tuple[float, float, float]] = {}
+
+# Anomaly detection and crash details read the same crash-like events for the
+# same window back-to-back; one Events API response serves both.
+# (service, sources, window_s) -> (expires_at, events). Events are stored as a
+# tuple so callers sharing a cached response can't change it for each other.
+_CRASH_EVENT_SOURCES = "error,crash,exception"
+_EVENTS_TTL_S = 60
+_EVENTS_CACHE_MAX = 1024
+_EVENTS_CACHE: dict[tuple[str, str, int], tuple[float, tuple]] = {}
+
+# Guards both caches; SLI workers and the sync/async detection paths share them
+_CACHE_LOCK = threading.Lock()
+
+# Max crash logs returned by one Logs Search request
+_CRASH_LOG_LIMIT = 100
+
+# Case-insensitive keyword scans over event text, without lowering a copy
+_CRASH_RE = re.compile(r"crash|exception|fatal", re.IGNORECASE)
+_PROD_RE = re.compile(r"prod", re.IGNORECASE)
+
+# Indexed by how many of the 3x / 5x spike-ratio bands a reading clears
+_SEVERITY_BY_RATIO = ("medium", "high", "critical")
+
 
 @track_dd_query
 def detect_anomalies(
@@ -42,6 +88,29 @@ def detect_anomalies(
     return _detect_anomalies_live(service, lookback_minutes)
 
 
+@track_dd_query
+async def detect_anomalies_async(
+    service: str,
+    lookback_minutes: int = 15,
+) -> list[dict[str, Any]]:
+    """
+    Awaitable detect_anomalies for callers already running an event loop.
+
+    Live paths use datadog_api_client's AsyncApiClient when its async extra
+    (aiosonic) is installed; otherwise the sync implementation runs in a
+    worker thread so the loop is never blocked.
+    """
+    if DD_MOCK_SERVER or not (AGENT_ENV == "demo" or not DD_API_KEY):
+        try:
+            from datadog_api_client import AsyncApiClient  # noqa: F401
+            import aiosonic  # noqa: F401
+        except ImportError:
+            return await asyncio.to_thread(_detect_anomalies_live, service, lookback_minutes)
+        return await _detect_anomalies_live_async(service, lookback_minutes)
+    
+    return _detect_anomalies_demo(service, lookback_minutes)
+
+
 @track_dd_query
 def fetch_crash_details(
     service: str,
@@ -97,10 +166,11 @@ def fetch_recent_deployments(
 def _mock_config():
     """Build a Configuration pointing at the mock server with dummy keys."""
     from datadog_api_client import Configuration
-    from urllib.parse import urlparse
     config = Configuration()
     config.api_key["apiKeyAuth"] = DD_API_KEY or "mock-api-key"
     config.api_key["appKeyAuth"] = DD_APP_KEY or "mock-app-key"
+    # Let every SLI worker hold its own pooled connection
+    config.connection_pool_maxsize = _SLI_QUERY_WORKERS
     if DD_MOCK_SERVER:
         parsed = urlparse(DD_MOCK_SERVER)
         config.host = f"{parsed.scheme}://{parsed.netloc}"
@@ -110,109 +180,101 @@ def _mock_config():
     return config
 
 
+_API_CLIENT = None
+_API_CLIENT_LOCK = threading.Lock()
+
+
+def _get_api_client():
+    """Return the shared ApiClient, building it on first use so connections stay pooled."""
+    global _API_CLIENT
+    if _API_CLIENT is None:
+        with _API_CLIENT_LOCK:
+            if _API_CLIENT is None:
+                from datadog_api_client import ApiClient
+                _API_CLIENT = ApiClient(_mock_config())
+                atexit.register(_API_CLIENT.close)
+    return _API_CLIENT
+
+
+# AsyncApiClient's aiosonic pool belongs to the event loop it runs on, so
+# unlike the sync client there is one per running loop:
+# loop -> (client, task that closes it when the loop shuts down)
+_ASYNC_API_CLIENTS: dict[asyncio.AbstractEventLoop, tuple[Any, asyncio.Task]] = {}
+
+
+def _get_async_api_client():
+    """Return the AsyncApiClient for the running event loop, building it on first use."""
+    loop = asyncio.get_running_loop()
+    with _API_CLIENT_LOCK:
+        entry = _ASYNC_API_CLIENTS.get(loop)
+        if entry is None:
+            from datadog_api_client import AsyncApiClient
+            api_client = AsyncApiClient(_mock_config())
+            # The loop only holds tasks weakly; keeping it here keeps it alive
+            entry = _ASYNC_API_CLIENTS[loop] = (
+                api_client,
+                loop.create_task(_close_on_loop_shutdown(loop, api_client)),
+            )
+    return entry[0]
+
+
+async def _close_on_loop_shutdown(loop: asyncio.AbstractEventLoop, api_client) -> None:
+    """
+    Park until the loop cancels its remaining tasks on shutdown (asyncio.run
+    and uvicorn both do), then close the client and its connection pool.
+    """
+    try:
+        await loop.create_future()
+    finally:
+        with _API_CLIENT_LOCK:
+            _ASYNC_API_CLIENTS.pop(loop, None)
+        await api_client.close()
+
+
 def _detect_anomalies_live(
     service: str,
     lookback_minutes: int,
 ) -> list[dict[str, Any]]:
     """Detect anomalies using Datadog API (or mock server)."""
     try:
-        from datadog_api_client import ApiClient
-        from datadog_api_client.v1.api.events_api import EventsApi
         from datadog_api_client.v1.api.metrics_api import MetricsApi
         
-        config = _mock_config()
+        api_client = _get_api_client()
         
         now = int(time.time())
         start = now - (lookback_minutes * 60)
+        # Baseline covers the last 7 days; the lookback window is sliced out of it locally
+        baseline_start = now - (7 * 24 * 60 * 60)
         
         anomalies = []
         
-        with ApiClient(config) as api_client:
-            # Check for crash_rate anomalies
-            metrics_api = MetricsApi(api_client)
-            
-            for sli in KEY_SLIS:
-                if sli not in ["crash_rate", "error_rate"]:
-                    continue
-                
-                query = f"avg:{sli}{{service:{service}}}"
-                try:
-                    response = metrics_api.query_metrics(_from=start, to=now, query=query)
-                    
-                    # Get baseline from last 7 days
-                    baseline_start = now - (7 * 24 * 60 * 60)
-                    baseline_response = metrics_api.query_metrics(
-                        _from=baseline_start, to=now, query=query
-                    )
-                    
-                    # Calculate if current value is anomalous
-                    current_points = []
-                    baseline_points = []
-                    
-                    for series in (response.series or []):
-                        for pt in (series.pointlist or []):
-                            if pt.value is not None:
-                                current_points.append(pt.value)
-                    
-                    for series in (baseline_response.series or []):
-                        for pt in (series.pointlist or []):
-                            if pt.value is not None:
-                                baseline_points.append(pt.value)
-                    
-                    if current_points and baseline_points:
-                        import statistics
-                        current_avg = statistics.mean(current_points)
-                        baseline_avg = statistics.mean(baseline_points)
-                        baseline_std = statistics.stdev(baseline_points) if len(baseline_points) > 1 else 0
-                        
-                        # Anomaly if > 2 standard deviations above baseline
-                        threshold = baseline_avg + (2 * baseline_std)
-                        if current_avg > threshold and baseline_avg > 0:
-                            anomaly_type = "crash" if "crash" in sli else "error_spike"
-                            severity = (
-                                "critical" if current_avg > baseline_avg * 5
-                                else "high" if current_avg > baseline_avg * 3
-                                else "medium"
-                            )
-                            
-                            anomalies.append({
-                                "type": anomaly_type,
-                                "severity": severity,
-                                "service": service,
-                                "sli": sli,
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                                "current_value": round(current_avg, 4),
-                                "baseline_avg": round(baseline_avg, 4),
-                                "spike_ratio": round(current_avg / baseline_avg, 2) if baseline_avg > 0 else 0,
-                                "description": f"{sli} spike detected: {current_avg:.4f} vs baseline {baseline_avg:.4f}",
-                            })
-                
-                except Exception as e:
-                    logger.warning(f"Failed to check {sli} for anomalies: {e}")
-            
-            # Also check Events API for crash events
-            events_api = EventsApi(api_client)
+        # Check for crash_rate anomalies
+        metrics_api = MetricsApi(api_client)
+        
+        # Fan the per-SLI queries out so their round-trips overlap
+        futures = []
+        for sli in _ANOMALY_SLIS:
+            futures.append((sli, _SLI_EXECUTOR.submit(
+                _query_sli, metrics_api, service, sli, baseline_start, start, now
+            )))
+        
+        detected_at = datetime.now(timezone.utc).isoformat()
+        for sli, future in futures:
             try:
-                response = events_api.list_events(
-                    start=start,
-                    end=now,
-                    tags=f"service:{service}",
-                    sources="error,crash,exception",
-                )
-                
-                for ev in (response.events or []):
-                    if "crash" in ev.text.lower() or "exception" in ev.text.lower():
-                        anomalies.append({
-                            "type": "crash",
-                            "severity": "high",
-                            "service": service,
-                            "timestamp": datetime.fromtimestamp(ev.date_happened, tz=timezone.utc).isoformat(),
-                            "description": ev.text or "",
-                            "event_id": str(ev.id),
-                            "tags": ev.tags or [],
-                        })
+                current_points, baseline_avg, baseline_std = future.result()
+                anomaly = _sli_anomaly(service, sli, current_points, baseline_avg, baseline_std, detected_at)
+                if anomaly:
+                    anomalies.append(anomaly)
+            
             except Exception as e:
-                logger.warning(f"Failed to fetch crash events: {e}")
+                logger.warning(f"Failed to check {sli} for anomalies: {e}")
+        
+        # Also check Events API for crash events
+        try:
+            events = _list_events_cached(service, _CRASH_EVENT_SOURCES, lookback_minutes * 60)
+            anomalies.extend(_event_anomalies(service, events))
+        except Exception as e:
+            logger.warning(f"Failed to fetch crash events: {e}")
         
         return anomalies
     
@@ -221,56 +283,331 @@ def _detect_anomalies_live(
         return []
 
 
-def _fetch_crash_details_live(
+async def _detect_anomalies_live_async(
     service: str,
-    platform: str | None,
     lookback_minutes: int,
 ) -> list[dict[str, Any]]:
-    """Fetch detailed crash information from Datadog (or mock server)."""
+    """Detect anomalies with AsyncApiClient, gathering SLI and event queries."""
     try:
-        from datadog_api_client import ApiClient
         from datadog_api_client.v1.api.events_api import EventsApi
-        from datadog_api_client.v1.api.logs_api import LogsApi
-        
-        config = _mock_config()
+        from datadog_api_client.v1.api.metrics_api import MetricsApi
         
         now = int(time.time())
         start = now - (lookback_minutes * 60)
+        baseline_start = now - (7 * 24 * 60 * 60)
         
+        api_client = _get_async_api_client()
+        metrics_api = MetricsApi(api_client)
+        coros = [
+            _query_sli_async(metrics_api, service, sli, baseline_start, start, now)
+            for sli in _ANOMALY_SLIS
+        ]
+        # Crash details read the same events; reuse a fresh response like the sync path
+        events_key = (service, _CRASH_EVENT_SOURCES, lookback_minutes * 60)
+        events = _fresh_events(events_key)
+        if events is None:
+            coros.append(EventsApi(api_client).list_events(
+                start=start,
+                end=now,
+                tags=f"service:{service}",
+                sources=_CRASH_EVENT_SOURCES,
+            ))
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        
+        anomalies = []
+        detected_at = datetime.now(timezone.utc).isoformat()
+        for sli, result in zip(_ANOMALY_SLIS, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to check {sli} for anomalies: {result}")
+                continue
+            anomaly = _sli_anomaly(service, sli, *result, detected_at)
+            if anomaly:
+                anomalies.append(anomaly)
+        
+        if events is None:
+            events_response = results[-1]
+            if isinstance(events_response, Exception):
+                logger.warning(f"Failed to fetch crash events: {events_response}")
+            else:
+                events = tuple(events_response.events or ())
+                _bounded_put(_EVENTS_CACHE, events_key, (time.time() + _EVENTS_TTL_S, events), _EVENTS_CACHE_MAX)
+        if events is not None:
+            anomalies.extend(_event_anomalies(service, events))
+        
+        return anomalies
+    
+    except Exception as e:
+        logger.error(f"Anomaly detection failed: {e}")
+        return []
+
+
+def _sli_anomaly(
+    service: str,
+    sli: str,
+    current_points: list[float],
+    baseline_avg: float | None,
+    baseline_std: float,
+    detected_at: str,
+) -> dict[str, Any] | None:
+    """Return an anomaly record if the current window breaches the baseline."""
+    if not current_points or baseline_avg is None:
+        return None
+    current_avg = math.fsum(current_points) / len(current_points)
+    
+    # Anomaly if > 2 standard deviations above a positive baseline
+    if baseline_avg <= 0 or current_avg <= baseline_avg + 2 * baseline_std:
+        return None
+    
+    spike_ratio = current_avg / baseline_avg
+    severity = _SEVERITY_BY_RATIO[(spike_ratio > 3) + (spike_ratio > 5)]
+    
+    return {
+        "type": "crash" if "crash" in sli else "error_spike",
+        "severity": severity,
+        "service": service,
+        "sli": sli,
+        "timestamp": detected_at,
+        "current_value": round(current_avg, 4),
+        "baseline_avg": round(baseline_avg, 4),
+        "spike_ratio": round(spike_ratio, 2),
+        "description": f"{sli} spike detected: {current_avg:.4f} vs baseline {baseline_avg:.4f}",
+    }
+
+
+def _event_anomalies(service: str, events: Iterable) -> list[dict[str, Any]]:
+    """Turn crash-like Datadog events into anomaly records."""
+    anomalies = []
+    for ev in events:
+        if _CRASH_RE.search(ev.text or ""):
+            anomalies.append({
+                "type": "crash",
+                "severity": "high",
+                "service": service,
+                "timestamp": _iso_utc(ev.date_happened),
+                "description": ev.text or "",
+                "event_id": str(ev.id),
+                "tags": ev.tags or [],
+            })
+    return anomalies
+
+
+def _query_sli(
+    metrics_api,
+    service: str,
+    sli: str,
+    baseline_start: int,
+    start: int,
+    now: int,
+) -> tuple[list[float], float | None, float]:
+    """
+    Fetch one SLI's current-window points plus its baseline (avg, stdev).
+
+    The baseline is served from _BASELINE_CACHE while fresh, in which case
+    only the short lookback window is queried.
+    """
+    query = f"avg:{sli}{{service:{service}}}"
+    cached = _fresh_baseline(service, sli)
+    if cached:
+        response = metrics_api.query_metrics(_from=start, to=now, query=query)
+        return _current_values(response), *cached
+    
+    # Cache miss: the 7-day series also contains the current window
+    response = metrics_api.query_metrics(_from=baseline_start, to=now, query=query)
+    return _summarise_baseline(response, service, sli, start)
+
+
+async def _query_sli_async(
+    metrics_api,
+    service: str,
+    sli: str,
+    baseline_start: int,
+    start: int,
+    now: int,
+) -> tuple[list[float], float | None, float]:
+    """Awaitable counterpart of _query_sli for the AsyncApiClient MetricsApi."""
+    query = f"avg:{sli}{{service:{service}}}"
+    cached = _fresh_baseline(service, sli)
+    if cached:
+        response = await metrics_api.query_metrics(_from=start, to=now, query=query)
+        return _current_values(response), *cached
+    
+    response = await metrics_api.query_metrics(_from=baseline_start, to=now, query=query)
+    return _summarise_baseline(response, service, sli, start)
+
+
+def _fresh_baseline(service: str, sli: str) -> tuple[float, float] | None:
+    """Return the cached (avg, stdev) for an SLI if it has not expired."""
+    key = (service, sli)
+    with _CACHE_LOCK:
+        cached = _BASELINE_CACHE.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.time():
+            del _BASELINE_CACHE[key]
+            return None
+    return cached[1], cached[2]
+
+
+def _bounded_put(cache: dict, key: Any, value: Any, max_size: int) -> None:
+    """Insert into a TTL cache, evicting the oldest entries so it stays under ``max_size``."""
+    with _CACHE_LOCK:
+        # Re-inserting moves a refreshed key to the newest end
+        cache.pop(key, None)
+        while len(cache) >= max_size:
+            # Evict the oldest insertion; dicts preserve insertion order
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+
+def _current_values(response) -> list[float]:
+    """Flatten a query_metrics response into its non-null values."""
+    return [
+        pt.value[1]
+        for series in (response.series or [])
+        for pt in (series.pointlist or [])
+        if pt.value[1] is not None
+    ]
+
+
+def _summarise_baseline(
+    response,
+    service: str,
+    sli: str,
+    start: int,
+) -> tuple[list[float], float | None, float]:
+    """Stream a 7-day response into (current-window values, avg, stdev) and cache the baseline."""
+    current_points = []
+    baseline = _Welford()
+    for series in (response.series or []):
+        for pt in (series.pointlist or []):
+            # Each point is a [timestamp_ms, value] pair
+            ts_ms, value = pt.value
+            if value is None:
+                continue
+            baseline.push(value)
+            if ts_ms / 1000 >= start:
+                current_points.append(value)
+    
+    if not baseline.n:
+        return current_points, None, 0
+    
+    baseline_avg, baseline_std = baseline.mean, baseline.stdev
+    _bounded_put(
+        _BASELINE_CACHE,
+        (service, sli),
+        (time.time() + _BASELINE_TTL_S, baseline_avg, baseline_std),
+        _BASELINE_CACHE_MAX,
+    )
+    return current_points, baseline_avg, baseline_std
+
+
+def _iso_utc(ts: int) -> str:
+    """Format epoch seconds like datetime.isoformat() in UTC, without building datetimes."""
+    t = time.gmtime(ts)
+    return "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec,
+    )
+
+
+def _fresh_events(key: tuple[str, str, int]) -> tuple | None:
+    """Return the cached events for a key if they have not expired."""
+    with _CACHE_LOCK:
+        cached = _EVENTS_CACHE.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.time():
+            del _EVENTS_CACHE[key]
+            return None
+    return cached[1]
+
+
+def _list_events_cached(service: str, sources: str, window_s: int) -> tuple:
+    """List events for the trailing window, reusing a fresh cached response."""
+    key = (service, sources, window_s)
+    events = _fresh_events(key)
+    if events is not None:
+        return events
+    
+    from datadog_api_client.v1.api.events_api import EventsApi
+    
+    now = int(time.time())
+    response = EventsApi(_get_api_client()).list_events(
+        start=now - window_s,
+        end=now,
+        tags=f"service:{service}",
+        sources=sources,
+    )
+    events = tuple(response.events or ())
+    _bounded_put(_EVENTS_CACHE, key, (time.time() + _EVENTS_TTL_S, events), _EVENTS_CACHE_MAX)
+    return events
+
+
+class _Welford:
+    """Streaming mean / sample variance accumulator (Welford's algorithm)."""
+
+    __slots__ = ("n", "mean", "M2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+
+    def push(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.M2 += delta * (x - self.mean)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.M2 / (self.n - 1)) if self.n > 1 else 0
+
+
+def _fetch_crash_details_live(
+    service: str,
+    platform: str | None,
+    lookback_minutes: int,
+) -> list[dict[str, Any]]:
+    """Fetch detailed crash information from Datadog (or mock server)."""
+    try:
         crashes = []
         
-        with ApiClient(config) as api_client:
-            # Query logs for crash/exception patterns
-            logs_api = LogsApi(api_client)
-            
-            query = f"service:{service} (crash OR exception OR fatal)"
-            if platform:
-                query += f" platform:{platform}"
+        try:
+            # Logs Search filters crash/exception/fatal server-side
+            for log in _search_crash_logs(service, platform, lookback_minutes):
+                attrs = log.attributes
+                crashes.append({
+                    "crash_id": str(log.id),
+                    "timestamp": attrs.timestamp.isoformat() if attrs.timestamp else "",
+                    "service": service,
+                    "platform": platform or "unknown",
+                    "error_message": attrs.message or "",
+                    "description": attrs.message or "",
+                    "tags": attrs.tags or [],
+                })
+        except Exception as e:
+            logger.warning(f"Logs search failed, falling back to events: {e}")
+        
+        # Setups that report crashes as events rather than logs find nothing there
+        if crashes:
+            return crashes
+        
+        try:
+            # Events API as a proxy (shared with anomaly detection)
+            events = _list_events_cached(service, _CRASH_EVENT_SOURCES, lookback_minutes * 60)
             
-            try:
-                # Note: This is a simplified version - actual implementation would use
-                # Datadog Logs Search API which requires more complex setup
-                # For now, we'll use Events API as a proxy
-                events_api = EventsApi(api_client)
-                response = events_api.list_events(
-                    start=start,
-                    end=now,
-                    tags=f"service:{service}",
-                    sources="error,crash",
-                )
-                
-                for ev in (response.events or []):
-                    crashes.append({
-                        "crash_id": str(ev.id),
-                        "timestamp": datetime.fromtimestamp(ev.date_happened, tz=timezone.utc).isoformat(),
-                        "service": service,
-                        "platform": platform or "unknown",
-                        "error_message": ev.text or "",
-                        "description": ev.title or "",
-                        "tags": ev.tags or [],
-                    })
-            except Exception as e:
-                logger.warning(f"Failed to fetch crash details: {e}")
+            for ev in events:
+                crashes.append({
+                    "crash_id": str(ev.id),
+                    "timestamp": _iso_utc(ev.date_happened),
+                    "service": service,
+                    "platform": platform or "unknown",
+                    "error_message": ev.text or "",
+                    "description": ev.title or "",
+                    "tags": ev.tags or [],
+                })
+        except Exception as e:
+            logger.warning(f"Failed to fetch crash details: {e}")
         
         return crashes
     
@@ -279,48 +616,61 @@ def _fetch_crash_details_live(
         return []
 
 
+def _search_crash_logs(
+    service: str,
+    platform: str | None,
+    lookback_minutes: int,
+) -> list:
+    """Return crash/exception/fatal logs for the window via the v2 Logs Search API."""
+    from datadog_api_client.v2.api.logs_api import LogsApi
+    from datadog_api_client.v2.model.logs_list_request import LogsListRequest
+    from datadog_api_client.v2.model.logs_list_request_page import LogsListRequestPage
+    from datadog_api_client.v2.model.logs_query_filter import LogsQueryFilter
+    
+    query = f"service:{service} (crash OR exception OR fatal)"
+    if platform:
+        query += f" @platform:{platform}"
+    
+    now = int(time.time())
+    body = LogsListRequest(
+        filter=LogsQueryFilter(
+            query=query,
+            _from=_iso_utc(now - lookback_minutes * 60),
+            to=_iso_utc(now),
+        ),
+        page=LogsListRequestPage(limit=_CRASH_LOG_LIMIT),
+    )
+    response = LogsApi(_get_api_client()).list_logs(body=body)
+    return response.data or []
+
+
 def _fetch_deployments_live(
     service: str,
     lookback_hours: int,
 ) -> list[dict[str, Any]]:
     """Fetch recent deployments from Datadog Events (or mock server)."""
     try:
-        from datadog_api_client import ApiClient
-        from datadog_api_client.v1.api.events_api import EventsApi
-        
-        config = _mock_config()
-        
-        now = int(time.time())
-        start = now - (lookback_hours * 3600)
-        
         deployments = []
         
-        with ApiClient(config) as api_client:
-            api = EventsApi(api_client)
-            response = api.list_events(
-                start=start,
-                end=now,
-                tags=f"service:{service}",
-                sources="deploy,deployment",
-            )
+        events = _list_events_cached(service, "deploy,deployment", lookback_hours * 3600)
+        
+        for ev in events:
+            # Extract feature name from tags or title
+            feature_name = ev.title or ""
+            for tag in (ev.tags or []):
+                if "feature:" in tag or "version:" in tag:
+                    feature_name = tag.split(":")[-1]
+                    break
             
-            for ev in (response.events or []):
-                # Extract feature name from tags or title
-                feature_name = ev.title or ""
-                for tag in (ev.tags or []):
-                    if "feature:" in tag or "version:" in tag:
-                        feature_name = tag.split(":")[-1]
-                        break
-                
-                deployments.append({
-                    "deployment_id": str(ev.id),
-                    "timestamp": datetime.fromtimestamp(ev.date_happened, tz=timezone.utc).isoformat(),
-                    "service": service,
-                    "feature_name": feature_name,
-                    "environment": "production" if "prod" in (ev.text or "").lower() else "alpha",
-                    "description": ev.text or "",
-                    "tags": ev.tags or [],
-                })
+            deployments.append({
+                "deployment_id": str(ev.id),
+                "timestamp": _iso_utc(ev.date_happened),
+                "service": service,
+                "feature_name": feature_name,
+                "environment": "production" if _PROD_RE.search(ev.text or "") else "alpha",
+                "description": ev.text or "",
+                "tags": ev.tags or [],
+            })
         
         return deployments
     
@@ -338,7 +688,6 @@ def _detect_anomalies_demo(
     lookback_minutes: int,
 ) -> list[dict[str, Any]]:
     """Demo mode: return synthetic anomalies."""
-    import random
     
     # Simulate occasional anomalies
     if random.random() > 0.7:  # 30% chance of anomaly
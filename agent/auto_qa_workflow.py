@@ -15,9 +15,14 @@ When a crash/anomaly is detected, this workflow:
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from agent.anomaly_detector import (
     detect_anomalies,
     fetch_crash_details,
@@ -25,10 +30,16 @@ from agent.anomaly_detector import (
 )
 from agent.code_analyzer import analyze_crash_reproducibility
 from agent.reproduction_tester import test_reproduction, test_web_reproduction
-from agent.observability import start_run, logger
+from agent.observability import start_run, logger, submit_in_context
 from agent.bedrock_summarizer import generate_report
 from agent.risk_model import RiskAssessment
 
+# Upper bound on crashes analysed/reproduced in parallel
+_CRASH_WORKERS = 8
+
+# Report consumed by the web dashboard
+_WEB_REPORT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "web", "auto_qa_report.json")
+
 
 def run_auto_qa_workflow(
     service: str,
@@ -63,6 +74,9 @@ def run_auto_qa_workflow(
         "test_environment": test_environment,
     })
     
+    # One timestamp for the run, shared by the report and every result
+    run_ts = datetime.now(timezone.utc).isoformat()
+    
     try:
         logger.info(f"[{run_ctx.run_id}] Starting auto-QA workflow for {service}...")
         
@@ -74,45 +88,38 @@ def run_auto_qa_workflow(
             logger.info(f"[{run_ctx.run_id}] No anomalies detected")
             no_report = {
                 "run_id": run_ctx.run_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": run_ts,
                 "status": "no_anomalies",
                 "service": service,
                 "message": "No anomalies or crashes detected in the specified time window",
             }
-            import json, os
-            web_report = os.path.join(os.path.dirname(os.path.dirname(__file__)), "web", "auto_qa_report.json")
-            try:
-                with open(web_report, "w") as f:
-                    json.dump(no_report, f, indent=2, default=str)
-            except Exception:
-                pass
+            _atomic_write_report(no_report)
             return no_report
         
         logger.info(f"[{run_ctx.run_id}] Found {len(anomalies)} anomalies")
         
-        # Process each anomaly
-        results = []
+        # Crash details and deployments don't depend on the anomaly; fetch once
+        crash_details_all = fetch_crash_details(
+            service=service,
+            platform=platform,
+            lookback_minutes=lookback_minutes,
+        )
+        deployments = fetch_recent_deployments(service, lookback_hours=24)
+        recent_deployment = deployments[0] if deployments else None
+        
         for anomaly in anomalies:
             logger.info(f"[{run_ctx.run_id}] Processing anomaly: {anomaly.get('type')} - {anomaly.get('description')}")
-            
-            # Get detailed crash information
-            crash_details = fetch_crash_details(
-                service=service,
-                platform=platform,
-                lookback_minutes=lookback_minutes,
-            )
-            
-            if not crash_details:
-                # Use anomaly as crash details
-                crash_details = [anomaly]
-            
-            # Get recent deployments
-            deployments = fetch_recent_deployments(service, lookback_hours=24)
-            recent_deployment = deployments[0] if deployments else None
-            
-            # Process each crash
-            for crash in crash_details:
-                result = _process_crash(
+        
+        # Every anomaly shares the same crash details, so each crash is processed
+        # once; use the anomalies as crash details when Datadog has none
+        crashes = _unique_crashes(crash_details_all or anomalies)
+        
+        # Bedrock calls and reproduction runs are I/O bound; results keep crash order
+        with ThreadPoolExecutor(max_workers=min(_CRASH_WORKERS, len(crashes))) as executor:
+            futures = [
+                submit_in_context(
+                    executor,
+                    _process_crash,
                     crash=crash,
                     deployment=recent_deployment,
                     code_repo_path=code_repo_path,
@@ -120,8 +127,11 @@ def run_auto_qa_workflow(
                     service=service,
                     run_id=run_ctx.run_id,
                     base_url=base_url,
+                    run_ts=run_ts,
                 )
-                results.append(result)
+                for crash in crashes
+            ]
+            results = [future.result() for future in futures]
         
         # ── Generate summary report ──
         summary = _generate_qa_summary(results, service, run_ctx.run_id)
@@ -135,7 +145,7 @@ def run_auto_qa_workflow(
         
         report = {
             "run_id": run_ctx.run_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": run_ts,
             "status": "completed",
             "service": service,
             "anomalies_detected": len(anomalies),
@@ -144,14 +154,8 @@ def run_auto_qa_workflow(
             "summary": summary,
         }
         
-        import json, os
-        web_report = os.path.join(os.path.dirname(os.path.dirname(__file__)), "web", "auto_qa_report.json")
-        try:
-            with open(web_report, "w") as f:
-                json.dump(report, f, indent=2, default=str)
-            logger.info(f"[{run_ctx.run_id}] Dashboard report written to {web_report}")
-        except Exception as e:
-            logger.warning(f"Could not write dashboard report: {e}")
+        if _atomic_write_report(report):
+            logger.info(f"[{run_ctx.run_id}] Dashboard report written to {_WEB_REPORT_PATH}")
         
         return report
     
@@ -161,6 +165,37 @@ def run_auto_qa_workflow(
         raise
 
 
+def _unique_crashes(crashes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop repeated crash_ids, keeping the first; crashes without an id are all kept."""
+    seen = set()
+    unique = []
+    for crash in crashes:
+        crash_id = crash.get("crash_id")
+        if crash_id is not None:
+            if crash_id in seen:
+                continue
+            seen.add(crash_id)
+        unique.append(crash)
+    return unique
+
+
+def _atomic_write_report(report: dict[str, Any]) -> bool:
+    """Write the dashboard report via a temp file + os.replace so readers never see a partial file."""
+    tmp_path = f"{_WEB_REPORT_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str))
+        os.replace(tmp_path, _WEB_REPORT_PATH)
+        return True
+    except Exception as e:
+        logger.warning(f"Could not write dashboard report: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
 def _process_crash(
     crash: dict[str, Any],
     deployment: dict[str, Any] | None,
@@ -169,6 +204,7 @@ def _process_crash(
     service: str,
     run_id: str,
     base_url: str | None = None,
+    run_ts: str | None = None,
 ) -> dict[str, Any]:
     """Process a single crash through the full workflow."""
     
@@ -242,7 +278,7 @@ def _process_crash(
         "reproduction_test": test_result,
         "qa_recommendation": qa_recommendation,
         "severity": crash.get("severity", "medium"),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": run_ts or datetime.now(timezone.utc).isoformat(),
     }
 
 
@@ -289,8 +325,12 @@ def _generate_qa_summary(
     """Generate summary of all processed crashes."""
     
     total = len(results)
-    reproduced = sum(1 for r in results if r.get("reproduction_test", {}).get("reproduced", False))
-    not_reproducible = sum(1 for r in results if r.get("status") == "not_reproducible")
+    reproduced = not_reproducible = 0
+    for r in results:
+        if r.get("status") == "not_reproducible":
+            not_reproducible += 1
+        elif (r.get("reproduction_test") or {}).get("reproduced", False):
+            reproduced += 1
     needs_manual_qa = total - reproduced - not_reproducible
     
     # Calculate overall risk
@@ -0,0 +1,252 @@
+"""
+Shared Amazon Bedrock runtime client.
+
+boto3 clients are thread-safe and expensive to build (session bootstrap,
+endpoint resolution, TLS handshake), so the summarizer and code analyzer
+share one long-lived client instead of creating one per invocation.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+import orjson
+
+from agent.config import AWS_REGION, BEDROCK_INVOKE_MODEL_ID
+from agent.observability import logger, record_bedrock_throttle
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:  # boto3 not installed; Bedrock calls fail and callers fall back
+    class ClientError(Exception):
+        """Stand-in so throttle handling is a no-op without botocore."""
+
+# Model families Bedrock serves with latency-optimized inference
+_LATENCY_OPTIMIZED_MODELS = (
+    "claude-3-5-haiku",
+    "nova-pro",
+    "llama3-1-70b",
+    "llama3-1-405b",
+)
+
+# Claude models Bedrock supports prompt caching (cache_control) for
+_PROMPT_CACHE_MODELS = (
+    "claude-3-5-haiku",
+    "claude-3-7-sonnet",
+    "claude-sonnet-4",
+    "claude-opus-4",
+)
+
+# Errors botocore retries with backoff; still failing afterwards means we were throttled
+_THROTTLE_CODES = frozenset({
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "ModelTimeoutException",
+})
+
+# Models that rejected the latency flag in this process (e.g. unsupported region)
+_LATENCY_REJECTED: set[str] = set()
+
+# Identical requests (same model, prompt and max_tokens) reuse the completion.
+# sha256(method + model_id + body) -> (expires_at, response)
+_RESPONSE_TTL_S = 3600
+_RESPONSE_CACHE_MAX = 1024
+_RESPONSE_CACHE: dict[str, tuple[float, Any]] = {}
+# Requests being invoked right now; identical concurrent requests wait on the
+# first one instead of each calling Bedrock. Both dicts are guarded by the lock.
+_IN_FLIGHT: dict[str, Future] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+# Default per-request read timeout; callers with short expected outputs pass less
+_DEFAULT_READ_TIMEOUT_S = 30
+
+
+@functools.lru_cache(maxsize=4)
+def get_bedrock_client(read_timeout: int = _DEFAULT_READ_TIMEOUT_S):
+    """
+    Return the process-wide ``bedrock-runtime`` client, built on first use.
+
+    botocore fixes timeouts per client, so each distinct ``read_timeout``
+    gets its own long-lived client.
+    """
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=AWS_REGION,
+        config=Config(
+            # Adaptive mode adds client-side token-bucket rate limiting on throttles
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            connect_timeout=2,
+            read_timeout=read_timeout,
+            tcp_keepalive=True,
+            max_pool_connections=32,
+        ),
+    )
+
+
+def system_prompt(text: str, model_id: str = BEDROCK_INVOKE_MODEL_ID) -> str | list[dict[str, Any]]:
+    """
+    Wrap a static system prompt for the Messages API.
+
+    On models with Bedrock prompt caching the text is sent as an ephemeral
+    cache_control block so repeated calls reuse the prefix; other models get
+    the plain string, which they require.
+    """
+    if any(family in model_id for family in _PROMPT_CACHE_MODELS):
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+    return text
+
+
+def invoke_model(
+    body: dict[str, Any],
+    model_id: str = BEDROCK_INVOKE_MODEL_ID,
+    read_timeout: int = _DEFAULT_READ_TIMEOUT_S,
+) -> dict[str, Any]:
+    """
+    Invoke a Bedrock model and return the decoded JSON response.
+
+    Requests latency-optimized inference for supported models, retrying
+    with standard latency if Bedrock rejects the flag. ``read_timeout``
+    should roughly match the expected generation time so a slow instance
+    fails over to a retry instead of blocking the caller.
+    """
+    def invoke() -> dict[str, Any]:
+        response = _invoke("invoke_model", body, model_id, read_timeout)
+        return orjson.loads(response["body"].read())
+
+    result, _ = _cached(_cache_key("invoke_model", body, model_id), invoke)
+    return result
+
+
+def invoke_model_stream(
+    body: dict[str, Any],
+    model_id: str = BEDROCK_INVOKE_MODEL_ID,
+    on_text: Callable[[str], None] | None = None,
+) -> str:
+    """
+    Invoke an Anthropic model with a streamed response and return the full text.
+
+    ``on_text`` receives each text delta as it arrives so callers can render
+    partial output before generation finishes.
+    """
+    text, streamed = _cached(
+        _cache_key("invoke_model_with_response_stream", body, model_id),
+        lambda: _stream_text(body, model_id, on_text),
+    )
+    # Cached or shared with a concurrent identical request: deliver it in one piece
+    if not streamed and on_text:
+        on_text(text)
+    return text
+
+
+def _stream_text(
+    body: dict[str, Any],
+    model_id: str,
+    on_text: Callable[[str], None] | None,
+) -> str:
+    """Run a streamed invocation, passing each text delta to ``on_text``."""
+    response = _invoke("invoke_model_with_response_stream", body, model_id, _DEFAULT_READ_TIMEOUT_S)
+
+    parts = []
+    for event in response["body"]:
+        chunk = event.get("chunk")
+        if not chunk:
+            continue
+        payload = orjson.loads(chunk["bytes"])
+        if payload.get("type") != "content_block_delta":
+            continue
+        text = payload.get("delta", {}).get("text", "")
+        if text:
+            parts.append(text)
+            if on_text:
+                on_text(text)
+
+    return "".join(parts)
+
+
+def _invoke(method: str, body: dict[str, Any], model_id: str, read_timeout: int) -> dict[str, Any]:
+    """Call ``method`` on the shared client, preferring latency-optimized inference."""
+    client = get_bedrock_client(read_timeout)
+    call = getattr(client, method)
+    kwargs = {
+        "modelId": model_id,
+        "contentType": "application/json",
+        "accept": "application/json",
+        "body": orjson.dumps(body),
+    }
+
+    try:
+        if _supports_latency_optimized(model_id):
+            try:
+                return call(performanceConfigLatency="optimized", **kwargs)
+            except client.exceptions.ValidationException as e:
+                logger.warning(f"Latency-optimized inference unavailable for {model_id}: {e}")
+                _LATENCY_REJECTED.add(model_id)
+
+        return call(**kwargs)
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        if code in _THROTTLE_CODES:
+            record_bedrock_throttle(code)
+        raise
+
+
+def _supports_latency_optimized(model_id: str) -> bool:
+    if model_id in _LATENCY_REJECTED:
+        return False
+    return any(family in model_id for family in _LATENCY_OPTIMIZED_MODELS)
+
+
+def _cache_key(method: str, body: dict[str, Any], model_id: str) -> str:
+    payload = orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(f"{method}\n{model_id}\n".encode() + payload).hexdigest()
+
+
+def _cached(key: str, compute: Callable[[], Any]) -> tuple[Any, bool]:
+    """
+    Return ``(value, computed)`` for a request key.
+
+    A fresh cached response is reused. If an identical request is in
+    flight, wait for its result (or its exception). Otherwise run
+    ``compute`` and cache what it returns; ``computed`` is True only then.
+    Every caller gets a deep copy, so callers may modify the response.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            if cached[0] > time.time():
+                return copy.deepcopy(cached[1]), False
+            del _RESPONSE_CACHE[key]
+        future = _IN_FLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _IN_FLIGHT[key] = Future()
+
+    if not owner:
+        return copy.deepcopy(future.result()), False
+
+    try:
+        value = compute()
+    except BaseException as e:
+        with _RESPONSE_CACHE_LOCK:
+            del _IN_FLIGHT[key]
+        future.set_exception(e)
+        raise
+
+    with _RESPONSE_CACHE_LOCK:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            # Evict the oldest insertion; dicts preserve insertion order
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)), None)
+        _RESPONSE_CACHE[key] = (time.time() + _RESPONSE_TTL_S, value)
+        del _IN_FLIGHT[key]
+    future.set_result(value)
+    return copy.deepcopy(value), True
@@ -6,29 +6,43 @@ in demo mode or when Bedrock is unavailable.
 
 from __future__ import annotations
 
-import json
-from typing import Any
-
-from agent.config import AWS_REGION, BEDROCK_MODEL_ID, AGENT_ENV
+import asyncio
+import itertools
+import logging
+from typing import Any, Callable
+
+from agent.bedrock_client import invoke_model_stream, system_prompt
+from agent.config import AGENT_ENV
+from agent.observability import log_sampled
 from agent.risk_model import RiskAssessment
 
+_SUMMARY_SYSTEM = """You are a Release Risk Advisor. Write a concise 3-5 sentence risk summary for a pending release covering:
+the risk in plain English, the single most important thing to watch, and whether it resembles a specific past incident and why.
+Input keys: F feature, S service, P platform, R risk score, rec recommendation, sim/vol/anom score breakdown
+(similarity to past rollbacks, SLI volatility, current anomalies), driver = top risk driver,
+match = past rollback as id|feature|date|similarity|description (none if absent)."""
+
 
 def generate_report(
     assessment: RiskAssessment,
     feature_name: str,
     service: str,
     platform: str | None = None,
+    stream_callback: Callable[[str], None] | None = None,
 ) -> dict[str, Any]:
     """
     Produce the final risk report.
 
+    If ``stream_callback`` is given it receives the Bedrock summary text
+    incrementally as it streams in.
+
     Returns a dict with:
         risk_score, recommendation, summary, risk_drivers,
         monitoring_checks, rollback_thresholds, rollout_guidance,
         matched_patterns, evidence
     """
     # Try Bedrock first; fall back to template
-    summary = _generate_bedrock_summary(assessment, feature_name, service, platform)
+    summary = _generate_bedrock_summary(assessment, feature_name, service, platform, stream_callback)
     if summary is None:
         summary = _generate_template_summary(assessment, feature_name, service, platform)
 
@@ -53,6 +67,24 @@ def generate_report(
     }
 
 
+async def generate_report_async(
+    assessment: RiskAssessment,
+    feature_name: str,
+    service: str,
+    platform: str | None = None,
+    stream_callback: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Awaitable generate_report for callers already running an event loop.
+
+    The Bedrock call runs in a worker thread on the shared client, so it can
+    be gathered with other Bedrock work (e.g. crash analysis).
+    """
+    return await asyncio.to_thread(
+        generate_report, assessment, feature_name, service, platform, stream_callback,
+    )
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Bedrock (Claude) summarisation
 # ──────────────────────────────────────────────────────────────────────
@@ -62,38 +94,31 @@ def _generate_bedrock_summary(
     feature_name: str,
     service: str,
     platform: str | None,
+    stream_callback: Callable[[str], None] | None = None,
 ) -> str | None:
-    """Call Amazon Bedrock to generate a natural-language risk summary."""
-    if AGENT_ENV == "demo":
-        return None  # Skip in demo mode
-
+    """Call Amazon Bedrock to generate a natural-language risk summary (streamed)."""
     try:
-        import boto3
-
-        client = boto3.client("bedrock-runtime", region_name=AWS_REGION)
-
         prompt = _build_prompt(assessment, feature_name, service, platform)
 
-        body = json.dumps({
+        return invoke_model_stream({
             "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 1024,
+            "max_tokens": 256,
+            # A 3-5 sentence summary never needs a section break; stop at one
+            "stop_sequences": ["\n\n---"],
+            "system": system_prompt(_SUMMARY_SYSTEM),
             "messages": [
                 {"role": "user", "content": prompt}
             ],
-        })
+        }, on_text=stream_callback)
 
-        response = client.invoke_model(
-            modelId=BEDROCK_MODEL_ID,
-            contentType="application/json",
-            accept="application/json",
-            body=body,
-        )
+    except Exception as e:
+        log_sampled(logging.WARNING, f"[BedrockSummarizer] Failed: {e}")
+        return None
 
-        result = json.loads(response["body"].read())
-        return result.get("content", [{}])[0].get("text", "")
 
-    except Exception as e:
-        print(f"[BedrockSummarizer] Failed: {e}")
+if AGENT_ENV == "demo":
+    # Demo mode never calls Bedrock; bind the no-op once instead of checking per call
+    def _generate_bedrock_summary(*args, **kwargs) -> None:
         return None
 
 
@@ -103,44 +128,40 @@ def _build_prompt(
     service: str,
     platform: str | None,
 ) -> str:
-    matched = assessment.matched_signatures[:3]
-    matched_text = "\n".join(
-        f"  - {m['revert_id']} ({m['feature']}, {m['date'][:10]}): "
-        f"{m['description']} [similarity: {m['similarity']}]"
-        for m in matched
+    """Build the compact key=value prompt described by _SUMMARY_SYSTEM."""
+    lines = [
+        f"F={feature_name};S={service};P={platform or 'all'}",
+        f"R={assessment.risk_score}/100;rec={assessment.recommendation}",
+        f"sim={assessment.similarity_score}/50;vol={assessment.volatility_score}/30;"
+        f"anom={assessment.anomaly_score}/20",
+    ]
+    lines.extend(f"driver={d}" for d in itertools.islice(assessment.top_risk_drivers, 5))
+    lines.extend(
+        f"match={m['revert_id']}|{m['feature']}|{m['date'][:10]}|"
+        f"{m['similarity']}|{m['description']}"
+        for m in itertools.islice(assessment.matched_signatures, 3)
     )
+    return "\n".join(lines)
 
-    return f"""You are a Release Risk Advisor AI. Given the following data about a
-pending release, produce a concise risk summary in 3-5 sentences.
 
-Feature: {feature_name}
-Service: {service}
-Platform: {platform or 'all'}
-Risk Score: {assessment.risk_score}/100
-Recommendation: {assessment.recommendation}
+# ──────────────────────────────────────────────────────────────────────
+# Template fallback (no Bedrock required)
+# ──────────────────────────────────────────────────────────────────────
 
-Score Breakdown:
-  - Similarity to past rollbacks: {assessment.similarity_score}/50
-  - SLI volatility: {assessment.volatility_score}/30
-  - Current anomalies: {assessment.anomaly_score}/20
+_RISK_LABELS = {"ship": "LOW RISK", "ramp": "MODERATE RISK", "hold": "HIGH RISK"}
+_REC_EMOJI = {"ship": "🟢", "ramp": "🟡", "hold": "🔴"}
 
-Top Risk Drivers:
-{chr(10).join(f'  - {d}' for d in assessment.top_risk_drivers)}
+_TEMPLATE = """🔍 Risk Assessment for "{feature_name}" on {service} ({platform}): **{risk_label}** — Score {risk_score}/100
 
-Matched Historical Rollback Patterns:
-{matched_text or '  None found'}
+{rec_emoji} **Recommendation: {recommendation}**
+   {rollout_guidance}
 
-Provide:
-1. A plain-English summary of the risk
-2. The single most important thing to watch
-3. Whether this looks similar to a specific past incident and why
-"""
+{optional_sections}📈 **Score Breakdown:**
+   • Pattern similarity: {similarity_score}/50
+   • SLI volatility: {volatility_score}/30
+   • Current anomalies: {anomaly_score}/20"""
 
 
-# ──────────────────────────────────────────────────────────────────────
-# Template fallback (no Bedrock required)
-# ──────────────────────────────────────────────────────────────────────
-
 def _generate_template_summary(
     assessment: RiskAssessment,
     feature_name: str,
@@ -148,54 +169,36 @@ def _generate_template_summary(
     platform: str | None,
 ) -> str:
     """Generate a structured summary without LLM."""
-    lines = []
-
-    # Risk headline
-    risk_label = {
-        "ship": "LOW RISK",
-        "ramp": "MODERATE RISK",
-        "hold": "HIGH RISK",
-    }.get(assessment.recommendation, "UNKNOWN")
-
-    lines.append(
-        f"🔍 Risk Assessment for \"{feature_name}\" on {service} "
-        f"({platform or 'all platforms'}): "
-        f"**{risk_label}** — Score {assessment.risk_score}/100"
-    )
-    lines.append("")
-
-    # Recommendation
-    rec_emoji = {"ship": "🟢", "ramp": "🟡", "hold": "🔴"}.get(assessment.recommendation, "⚪")
-    lines.append(f"{rec_emoji} **Recommendation: {assessment.recommendation.upper()}**")
-    lines.append(f"   {assessment.rollout_guidance}")
-    lines.append("")
+    optional_sections = ""
 
     # Top risk drivers
     if assessment.top_risk_drivers:
-        lines.append("📊 **Top Risk Drivers:**")
-        for i, driver in enumerate(assessment.top_risk_drivers[:3], 1):
-            lines.append(f"   {i}. {driver}")
-        lines.append("")
+        optional_sections += "📊 **Top Risk Drivers:**\n" + "".join(
+            f"   {i}. {driver}\n"
+            for i, driver in enumerate(itertools.islice(assessment.top_risk_drivers, 3), 1)
+        ) + "\n"
 
     # Similar incidents
     if assessment.matched_signatures:
-        lines.append("🔄 **Similar Past Incidents:**")
-        for m in assessment.matched_signatures[:2]:
-            lines.append(
-                f"   • {m['revert_id']} — \"{m['feature']}\" ({m['date'][:10]})"
-            )
-            lines.append(
-                f"     Similarity: {m['similarity']:.0%} | "
-                f"Severity: {m['severity']} | "
-                f"Impacted: {', '.join(m['impacted_slis'])}"
-            )
-        lines.append("")
-
-    # Score breakdown
-    lines.append("📈 **Score Breakdown:**")
-    lines.append(f"   • Pattern similarity: {assessment.similarity_score}/50")
-    lines.append(f"   • SLI volatility: {assessment.volatility_score}/30")
-    lines.append(f"   • Current anomalies: {assessment.anomaly_score}/20")
-
-    return "\n".join(lines)
-
+        optional_sections += "🔄 **Similar Past Incidents:**\n" + "".join(
+            f"   • {m['revert_id']} — \"{m['feature']}\" ({m['date'][:10]})\n"
+            f"     Similarity: {m['similarity']:.0%} | "
+            f"Severity: {m['severity']} | "
+            f"Impacted: {', '.join(m['impacted_slis'])}\n"
+            for m in itertools.islice(assessment.matched_signatures, 2)
+        ) + "\n"
+
+    return _TEMPLATE.format(
+        feature_name=feature_name,
+        service=service,
+        platform=platform or "all platforms",
+        risk_label=_RISK_LABELS.get(assessment.recommendation, "UNKNOWN"),
+        risk_score=assessment.risk_score,
+        rec_emoji=_REC_EMOJI.get(assessment.recommendation, "⚪"),
+        recommendation=assessment.recommendation.upper(),
+        rollout_guidance=assessment.rollout_guidance,
+        optional_sections=optional_sections,
+        similarity_score=assessment.similarity_score,
+        volatility_score=assessment.volatility_score,
+        anomaly_score=assessment.anomaly_score,
+    )
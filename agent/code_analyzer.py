@@ -9,13 +9,48 @@ When a crash is detected, this module:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import itertools
+import logging
 import subprocess
 from pathlib import Path
 from typing import Any
 
-from agent.config import AWS_REGION, BEDROCK_MODEL_ID, AGENT_ENV
-from agent.observability import logger
+import orjson
+
+from agent.bedrock_client import invoke_model, system_prompt
+from agent.config import AGENT_ENV
+from agent.observability import log_sampled, logger
+
+# Prompt budget: only +/- diff lines, a handful of files, bounded stack trace
+_MAX_DIFF_CHARS = 800
+_MAX_FILES = 5
+_MAX_STACK_CHARS = 1500
+_PROMPT_TOKEN_BUDGET = 1500  # ~4 chars/token
+_ANALYSIS_MAX_TOKENS = 512
+_ANALYSIS_READ_TIMEOUT_S = 15  # ~_ANALYSIS_MAX_TOKENS x 20 ms/token, plus headroom
+
+_ANALYSIS_SYSTEM = """You are a senior QA engineer deciding whether a production crash is reproducible.
+Input is key=value lines: service, error, desc, ts, stack (optional), deploy=feature|env|time (optional), files, feature, commit, and diff (changed lines only).
+Judge whether the diff plausibly causes the crash. Confidence: 0.8-1 clear matching bug, 0.5-0.8 likely related, <0.5 unclear.
+Report with the report_analysis tool; likely_cause is 1-2 sentences."""
+
+# Forced tool call so Bedrock returns the analysis as a parsed object
+_ANALYSIS_TOOL = {
+    "name": "report_analysis",
+    "description": "Report whether the crash is reproducible and how to reproduce it.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "is_reproducible": {"type": "boolean"},
+            "confidence": {"type": "number"},
+            "likely_cause": {"type": "string"},
+            "affected_files": {"type": "array", "items": {"type": "string"}},
+            "reproduction_steps": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["is_reproducible", "confidence", "likely_cause"],
+    },
+}
 
 
 def analyze_crash_reproducibility(
@@ -40,16 +75,35 @@ def analyze_crash_reproducibility(
             - reproduction_steps: list[str]
             - code_analysis: str
     """
-    if AGENT_ENV == "demo":
-        return _analyze_crash_demo(crash_details, deployment_info)
-    
+    return _analyze_crash(crash_details, deployment_info, code_repo_path)
+
+
+async def analyze_crash_reproducibility_async(
+    crash_details: dict[str, Any],
+    deployment_info: dict[str, Any] | None = None,
+    code_repo_path: str | None = None,
+) -> dict[str, Any]:
+    """
+    Awaitable analyze_crash_reproducibility for callers already running an event loop.
+
+    Runs in a worker thread on the shared Bedrock client, so it can be
+    gathered with other Bedrock work (e.g. the risk summary).
+    """
+    return await asyncio.to_thread(
+        analyze_crash_reproducibility, crash_details, deployment_info, code_repo_path,
+    )
+
+
+def _analyze_crash_live(
+    crash_details: dict[str, Any],
+    deployment_info: dict[str, Any] | None,
+    code_repo_path: str | None,
+) -> dict[str, Any]:
     # Get code changes
     code_changes = _get_recent_code_changes(deployment_info, code_repo_path)
     
     # Use Bedrock to analyze
-    analysis = _analyze_with_bedrock(crash_details, code_changes, deployment_info)
-    
-    return analysis
+    return _analyze_with_bedrock(crash_details, code_changes, deployment_info)
 
 
 def _get_recent_code_changes(
@@ -71,7 +125,7 @@ def _get_recent_code_changes(
     # Try to get git diff if repo path is provided
     if code_repo_path and Path(code_repo_path).exists():
         try:
-            # Get last commit diff
+            # Last commit diff; changed files come from its headers (one git process)
             result = subprocess.run(
                 ["git", "diff", "HEAD~1", "HEAD"],
                 cwd=code_repo_path,
@@ -81,23 +135,22 @@ def _get_recent_code_changes(
             )
             if result.returncode == 0:
                 changes["diff"] = result.stdout[:5000]  # Limit size
-                
-                # Get changed files
-                result = subprocess.run(
-                    ["git", "diff", "--name-only", "HEAD~1", "HEAD"],
-                    cwd=code_repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.returncode == 0:
-                    changes["files_changed"] = [f.strip() for f in result.stdout.split("\n") if f.strip()]
+                changes["files_changed"] = _diff_files(result.stdout)
         except Exception as e:
             logger.warning(f"Failed to get git diff: {e}")
     
     return changes
 
 
+def _diff_files(diff: str) -> list[str]:
+    """Changed paths from the 'diff --git a/X b/Y' headers of a unified diff."""
+    return [
+        line.rsplit(" b/", 1)[-1]
+        for line in diff.splitlines()
+        if line.startswith("diff --git ")
+    ]
+
+
 def _analyze_with_bedrock(
     crash_details: dict[str, Any],
     code_changes: dict[str, Any],
@@ -105,41 +158,28 @@ def _analyze_with_bedrock(
 ) -> dict[str, Any]:
     """Use Bedrock to analyze crash and code changes."""
     try:
-        import boto3
-        
-        client = boto3.client("bedrock-runtime", region_name=AWS_REGION)
-        
         # Build analysis prompt
         prompt = _build_analysis_prompt(crash_details, code_changes, deployment_info)
         
-        body = json.dumps({
+        result = invoke_model({
             "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 2048,
+            "max_tokens": _ANALYSIS_MAX_TOKENS,
+            "system": system_prompt(_ANALYSIS_SYSTEM),
+            "tools": [_ANALYSIS_TOOL],
+            "tool_choice": {"type": "tool", "name": _ANALYSIS_TOOL["name"]},
             "messages": [
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-        })
+        }, read_timeout=_ANALYSIS_READ_TIMEOUT_S)
         
-        response = client.invoke_model(
-            modelId=BEDROCK_MODEL_ID,
-            contentType="application/json",
-            accept="application/json",
-            body=body,
-        )
-        
-        result = json.loads(response["body"].read())
-        analysis_text = result.get("content", [{}])[0].get("text", "")
-        
-        # Parse structured response from Bedrock
-        analysis = _parse_bedrock_response(analysis_text, crash_details)
-        
-        return analysis
+        # Structured tool input from Bedrock
+        return _parse_bedrock_response(result)
     
     except Exception as e:
-        logger.error(f"Bedrock analysis failed: {e}")
+        log_sampled(logging.ERROR, f"Bedrock analysis failed: {e}")
         return {
             "is_reproducible": True,  # Default to true if analysis fails
             "confidence": 0.5,
@@ -155,126 +195,77 @@ def _build_analysis_prompt(
     code_changes: dict[str, Any],
     deployment_info: dict[str, Any] | None,
 ) -> str:
-    """Build prompt for Bedrock code analysis."""
+    """Build the compact key=value prompt for Bedrock code analysis (see _ANALYSIS_SYSTEM)."""
+    lines = [
+        f"service={crash_details.get('service', 'unknown')}",
+        f"error={crash_details.get('error_message', 'N/A')}",
+        f"desc={crash_details.get('description', 'N/A')}",
+        f"ts={crash_details.get('timestamp', 'N/A')}",
+    ]
+    if crash_details.get("stack_trace"):
+        lines.append(f"stack={crash_details['stack_trace'][:_MAX_STACK_CHARS]}")
     
-    crash_info = f"""
-Crash Details:
-- Service: {crash_details.get('service', 'unknown')}
-- Error: {crash_details.get('error_message', 'N/A')}
-- Description: {crash_details.get('description', 'N/A')}
-- Timestamp: {crash_details.get('timestamp', 'N/A')}
-"""
-    
-    if crash_details.get('stack_trace'):
-        crash_info += f"- Stack Trace: {crash_details['stack_trace']}\n"
+    if deployment_info:
+        lines.append(
+            f"deploy={deployment_info.get('feature_name', 'unknown')}"
+            f"|{deployment_info.get('environment', 'unknown')}"
+            f"|{deployment_info.get('timestamp', 'N/A')}"
+        )
     
-    code_info = ""
     if code_changes.get("files_changed"):
-        code_info = f"""
-Recent Code Changes:
-- Files Changed: {', '.join(code_changes['files_changed'][:10])}
-- Feature: {code_changes.get('feature_name', 'unknown')}
-- Commit: {code_changes.get('commit_sha', 'N/A')}
-
-Code Diff (last 2000 chars):
-{code_changes.get('diff', 'No diff available')[-2000:]}
-"""
+        lines.append(f"files={','.join(itertools.islice(code_changes['files_changed'], _MAX_FILES))}")
+        lines.append(f"feature={code_changes.get('feature_name', 'unknown')}")
+        lines.append(f"commit={code_changes.get('commit_sha', 'N/A')}")
+        diff = _changed_lines(code_changes.get("diff", ""))
+        lines.append(f"diff:\n{diff or 'none'}")
     
-    deployment_info_text = ""
-    if deployment_info:
-        deployment_info_text = f"""
-Deployment Info:
-- Feature: {deployment_info.get('feature_name', 'unknown')}
-- Environment: {deployment_info.get('environment', 'unknown')}
-- Deployed: {deployment_info.get('timestamp', 'N/A')}
-"""
-    
-    prompt = f"""You are a senior QA engineer analyzing a production crash to determine if it's reproducible.
-
-{crash_info}
-
-{deployment_info_text}
-
-{code_info}
-
-Based on the crash details and recent code changes, analyze:
-
-1. **Is this crash reproducible?** (yes/no)
-   - Consider: Does the code change directly relate to the crash?
-   - Are there obvious bugs in the diff that would cause this error?
-   - Is the crash pattern consistent with the code changes?
+    prompt = "\n".join(lines)
+    if len(prompt) // 4 > _PROMPT_TOKEN_BUDGET:
+        logger.warning(f"Analysis prompt ~{len(prompt) // 4} tokens exceeds budget {_PROMPT_TOKEN_BUDGET}")
+    return prompt
 
-2. **Confidence level** (0.0 to 1.0):
-   - High (0.8-1.0): Clear code bug matching crash pattern
-   - Medium (0.5-0.8): Likely related but needs verification
-   - Low (0.0-0.5): Unclear relationship
 
-3. **Likely root cause** (1-2 sentences):
-   - What specific code issue likely caused this crash?
+def _changed_lines(diff: str) -> str:
+    """Keep only added/removed lines of a unified diff, capped to the last _MAX_DIFF_CHARS.
 
-4. **Affected files** (list):
-   - Which files are most likely responsible?
+    Walks the diff backwards and stops once the cap is filled, so a large
+    diff is never split into a full list of lines.
+    """
+    kept = []
+    size = 0
+    end = len(diff)
+    while end > 0 and size <= _MAX_DIFF_CHARS:
+        start = diff.rfind("\n", 0, end) + 1
+        line = diff[start:end].rstrip("\r")
+        if line[:1] in ("+", "-") and not line.startswith(("+++", "---")):
+            kept.append(line)
+            size += len(line) + 1
+        end = start - 1
+    return "\n".join(reversed(kept))[-_MAX_DIFF_CHARS:]
 
-5. **Reproduction steps** (ordered list):
-   - How to reproduce this crash in alpha/production?
 
-Respond in JSON format:
-{{
-  "is_reproducible": true/false,
-  "confidence": 0.0-1.0,
-  "likely_cause": "explanation",
-  "affected_files": ["file1", "file2"],
-  "reproduction_steps": ["step1", "step2", "step3"]
-}}
-"""
+def _parse_bedrock_response(result: dict[str, Any]) -> dict[str, Any]:
+    """Extract the report_analysis tool input from a Bedrock Messages response."""
+    analysis = next(
+        block["input"]
+        for block in result.get("content", [])
+        if block.get("type") == "tool_use"
+    )
     
-    return prompt
-
-
-def _parse_bedrock_response(
-    response_text: str,
-    crash_details: dict[str, Any],
-) -> dict[str, Any]:
-    """Parse Bedrock's JSON response."""
-    try:
-        # Try to extract JSON from response
-        import re
-        
-        # Look for JSON block
-        json_match = re.search(r'\{[^{}]*"is_reproducible"[^{}]*\}', response_text, re.DOTALL)
-        if json_match:
-            analysis = json.loads(json_match.group())
-        else:
-            # Try parsing entire response as JSON
-            analysis = json.loads(response_text)
-        
-        return {
-            "is_reproducible": analysis.get("is_reproducible", True),
-            "confidence": float(analysis.get("confidence", 0.5)),
-            "likely_cause": analysis.get("likely_cause", "Unable to determine"),
-            "affected_files": analysis.get("affected_files", []),
-            "reproduction_steps": analysis.get("reproduction_steps", []),
-            "code_analysis": response_text[:1000],  # Store full analysis
-        }
-    
-    except Exception as e:
-        logger.warning(f"Failed to parse Bedrock response: {e}")
-        # Fallback: try to infer from text
-        is_reproducible = "reproducible" in response_text.lower() or "yes" in response_text.lower()[:100]
-        
-        return {
-            "is_reproducible": is_reproducible,
-            "confidence": 0.5,
-            "likely_cause": "Unable to parse analysis - see code_analysis field",
-            "affected_files": [],
-            "reproduction_steps": [],
-            "code_analysis": response_text[:1000],
-        }
+    return {
+        "is_reproducible": analysis.get("is_reproducible", True),
+        "confidence": float(analysis.get("confidence", 0.5)),
+        "likely_cause": analysis.get("likely_cause", "Unable to determine"),
+        "affected_files": analysis.get("affected_files", []),
+        "reproduction_steps": analysis.get("reproduction_steps", []),
+        "code_analysis": orjson.dumps(analysis).decode()[:1000],
+    }
 
 
 def _analyze_crash_demo(
     crash_details: dict[str, Any],
     deployment_info: dict[str, Any] | None,
+    code_repo_path: str | None = None,
 ) -> dict[str, Any]:
     """Demo mode: return synthetic analysis."""
     return {
@@ -290,3 +281,6 @@ def _analyze_crash_demo(
         "code_analysis": "Demo mode: Crash appears reproducible based on recent code changes removing null safety checks.",
     }
 
+
+# AGENT_ENV is fixed for the process; pick the implementation once at import
+_analyze_crash = _analyze_crash_demo if AGENT_ENV == "demo" else _analyze_crash_live
@@ -22,15 +22,34 @@ DD_MOCK_SERVER = os.getenv("DD_MOCK_SERVER", "")  # Mock server URL (e.g., http:
 
 # ── AWS Bedrock ──
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
+# Any value Bedrock accepts as modelId: a plain model id, a cross-region
+# inference profile id (e.g. "us.anthropic.claude-3-5-haiku-20241022-v1:0"),
+# or a provisioned-throughput / inference-profile ARN.
 BEDROCK_MODEL_ID = os.getenv(
     "BEDROCK_MODEL_ID",
     "anthropic.claude-3-sonnet-20240229-v1:0",
 )
+# Optional ARN that takes precedence over BEDROCK_MODEL_ID. On-demand
+# invocation is pay-per-token but shares regional capacity, so latency
+# varies and concurrent runs can hit ThrottlingException. A cross-region
+# inference profile spreads that load over several regions at on-demand
+# prices; Provisioned Throughput reserves dedicated model units for
+# predictable latency at a fixed hourly cost, which suits a steady
+# CI/CD request rate.
+BEDROCK_INFERENCE_PROFILE_ARN = os.getenv("BEDROCK_INFERENCE_PROFILE_ARN", "")
+# The modelId actually sent to Bedrock
+BEDROCK_INVOKE_MODEL_ID = BEDROCK_INFERENCE_PROFILE_ARN or BEDROCK_MODEL_ID
 
 # ── Agent defaults ──
 DEFAULT_HISTORY_WINDOW_DAYS = 30
 DEFAULT_POST_DEPLOY_MINUTES = 60
 AGENT_ENV = os.getenv("AGENT_ENV", "demo")
+# Simulated reproduction steps sleep to mimic real work; set to "false" for bulk/CI replays
+SIMULATE_DELAYS = os.getenv("SIMULATE_DELAYS", "true").lower() not in ("0", "false", "no")
+# Emit each finished run as a JSON log line for aggregators; off by default in demo
+AGENT_JSON_LOGS = os.getenv(
+    "AGENT_JSON_LOGS", "false" if AGENT_ENV == "demo" else "true"
+).lower() not in ("0", "false", "no")
 
 # ── Risk model weights ──
 WEIGHT_SIMILARITY = 50   # similarity to rollback signature (0-50)
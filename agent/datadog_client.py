@@ -8,10 +8,20 @@ realistic metric payloads so the agent can run without credentials.
 
 from __future__ import annotations
 
+import atexit
+import copy
+import functools
+import inspect
+import logging
+import os
 import random
+import statistics
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
@@ -25,27 +35,123 @@ from agent.config import (
     DEFAULT_HISTORY_WINDOW_DAYS,
     DEFAULT_POST_DEPLOY_MINUTES,
 )
-from agent.observability import track_dd_query
+from agent.observability import log_sampled, submit_in_context, track_dd_query
 
 
 # ──────────────────────────────────────────────────────────────────────
 # Data loader (YAML file for demo, Datadog API for prod)
 # ──────────────────────────────────────────────────────────────────────
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def _load_revert_history() -> dict:
-    """Load revert history from the YAML file."""
-    with open(REVERT_HISTORY_PATH, "r") as f:
-        return yaml.safe_load(f)
+    """Load revert history from the YAML file, re-parsing only when it changes on disk."""
+    return _parse_revert_history(REVERT_HISTORY_PATH, os.stat(REVERT_HISTORY_PATH).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_revert_history(path: str, mtime_ns: int) -> dict:
+    """Parse the YAML once per (path, mtime); callers must treat the result as read-only."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _revert_index() -> list[tuple[float, dict, frozenset[str]]]:
+    """Reverts as (epoch seconds, rev, tag set), in file order."""
+    return _build_revert_index(REVERT_HISTORY_PATH, os.stat(REVERT_HISTORY_PATH).st_mtime_ns)
+
 
+@functools.lru_cache(maxsize=1)
+def _build_revert_index(path: str, mtime_ns: int) -> list[tuple[float, dict, frozenset[str]]]:
+    """Parse each revert's date and tags once per file version."""
+    return [
+        (
+            datetime.fromisoformat(rev["date"].replace("Z", "+00:00")).timestamp(),
+            rev,
+            frozenset(rev.get("tags", [])),
+        )
+        for rev in _parse_revert_history(path, mtime_ns).get("reverts", [])
+    ]
+
+
+# AGENT_ENV and the Datadog keys are fixed for the life of the process
+_IS_LIVE = bool(AGENT_ENV != "demo" and DD_API_KEY and DD_APP_KEY)
+
+# Live fetch results are reused across runs for the same arguments; current
+# health gets a short TTL so post-deploy data doesn't go stale.
+_HISTORY_TTL_S = 300
+_HEALTH_TTL_S = 60
+_FETCH_CACHE_MAX = 1024
+_FETCH_CACHE: dict[tuple, tuple[float, Any]] = {}
+_FETCH_CACHE_LOCK = threading.Lock()
 
-def _is_live_mode() -> bool:
-    return AGENT_ENV != "demo" and DD_API_KEY and DD_APP_KEY
+# Set by a live fetch that fell back to an empty/zero result, so the cache
+# doesn't hold a Datadog blip for the whole TTL
+_fetch_degraded: ContextVar[bool] = ContextVar("fetch_degraded", default=False)
+
+
+def _mark_fetch_degraded() -> None:
+    _fetch_degraded.set(True)
+
+
+def _ttl_cached(ttl_s: float) -> Callable:
+    """
+    Cache a live fetch by its bound arguments for ``ttl_s`` seconds.
+
+    Applied outside @track_dd_query so cache hits are not counted as Datadog
+    queries. Callers get a deep copy, so they may modify the result. Fallback
+    results from failed fetches are returned but not cached.
+    Demo mode is left uncached (current health is randomised per call).
+    """
+    def decorator(fn: Callable) -> Callable:
+        if not _IS_LIVE:
+            return fn
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__,) + tuple(
+                tuple(v) if isinstance(v, list) else v for v in bound.arguments.values()
+            )
+            now = time.monotonic()
+            with _FETCH_CACHE_LOCK:
+                cached = _FETCH_CACHE.get(key)
+                if cached and cached[0] <= now:
+                    del _FETCH_CACHE[key]
+                    cached = None
+            if cached:
+                return copy.deepcopy(cached[1])
+
+            token = _fetch_degraded.set(False)
+            try:
+                result = fn(*args, **kwargs)
+                degraded = _fetch_degraded.get()
+            finally:
+                _fetch_degraded.reset(token)
+            if degraded:
+                return result
+
+            with _FETCH_CACHE_LOCK:
+                if len(_FETCH_CACHE) >= _FETCH_CACHE_MAX:
+                    # Evict the oldest insertion; dicts preserve insertion order
+                    _FETCH_CACHE.pop(next(iter(_FETCH_CACHE)), None)
+                _FETCH_CACHE[key] = (now + ttl_s, result)
+            return copy.deepcopy(result)
+
+        return wrapper
+
+    return decorator
 
 
 # ──────────────────────────────────────────────────────────────────────
 # Public API
 # ──────────────────────────────────────────────────────────────────────
 
+@_ttl_cached(_HISTORY_TTL_S)
 @track_dd_query
 def fetch_revert_events(
     service: str,
@@ -60,23 +166,26 @@ def fetch_revert_events(
         time_to_detection_min, time_to_rollback_min, impacted_slis,
         root_cause, tags
     """
-    if _is_live_mode():
-        return _fetch_revert_events_live(service, platform, window_days)
+    return _revert_events(service, platform, window_days)
 
-    # ── Demo mode: filter YAML data ──
-    data = _load_revert_history()
+
+def _fetch_revert_events_demo(
+    service: str,
+    platform: str | None,
+    window_days: int,
+) -> list[dict[str, Any]]:
+    """Demo mode: filter the revert-history YAML."""
     # In demo mode, use a very wide window so all sample data is included
-    cutoff = datetime.now(timezone.utc) - timedelta(days=max(window_days * 24, 3650))
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=max(window_days * 24, 3650))).timestamp()
     results = []
-    for rev in data.get("reverts", []):
-        rev_date = datetime.fromisoformat(rev["date"].replace("Z", "+00:00"))
-        if rev_date < cutoff:
+    for rev_ts, rev, rev_tags in _revert_index():
+        if rev_ts < cutoff:
             continue
         # Match on service name OR any matching tag
         service_match = (
             rev.get("service") == service
-            or service in rev.get("tags", [])
-            or any(t in service for t in rev.get("tags", []))
+            or service in rev_tags
+            or any(t in service for t in rev_tags)
         )
         if not service_match:
             continue
@@ -86,6 +195,7 @@ def fetch_revert_events(
     return results
 
 
+@_ttl_cached(_HISTORY_TTL_S)
 @track_dd_query
 def fetch_metric_baseline(
     service: str,
@@ -95,25 +205,46 @@ def fetch_metric_baseline(
     """
     Fetch the baseline (avg, p95, p99) for a given SLI over a time window.
     """
-    if _is_live_mode():
-        return _fetch_metric_baseline_live(service, sli, window_days)
+    return _metric_baselines(service, [sli], window_days)[sli]
+
+
+@_ttl_cached(_HISTORY_TTL_S)
+@track_dd_query
+def fetch_metric_baselines_batch(
+    service: str,
+    slis: list[str],
+    window_days: int = DEFAULT_HISTORY_WINDOW_DAYS,
+) -> dict[str, dict[str, Any]]:
+    """
+    Fetch baselines for several SLIs of one service in a single call.
+
+    Returns {sli: baseline} with the same shape as fetch_metric_baseline.
+    """
+    return _metric_baselines(service, slis, window_days)
 
-    # ── Demo mode ──
-    data = _load_revert_history()
-    baselines = data.get("baselines", {}).get(service, {})
-    base_val = baselines.get(sli, 0)
-    # Synthesise a realistic spread
-    return {
-        "sli": sli,
-        "service": service,
-        "window_days": window_days,
-        "avg": round(base_val, 3),
-        "p95": round(base_val * 1.3, 3),
-        "p99": round(base_val * 1.8, 3),
-        "stddev": round(base_val * 0.15, 3),
-    }
 
+# Demo-mode spread of each baseline stat relative to the SLI's average
+_DEMO_BASELINE_SPREAD = (("p95", 1.3), ("p99", 1.8), ("stddev", 0.15))
 
+
+def _metric_baselines_demo(
+    service: str,
+    slis: list[str],
+    window_days: int,
+) -> dict[str, dict[str, Any]]:
+    """Demo mode: synthesise a realistic spread from one YAML lookup."""
+    baselines = _load_revert_history().get("baselines", {}).get(service, {})
+    results = {}
+    for sli in slis:
+        base_val = baselines.get(sli, 0)
+        baseline = {"sli": sli, "service": service, "window_days": window_days, "avg": round(base_val, 3)}
+        for stat, factor in _DEMO_BASELINE_SPREAD:
+            baseline[stat] = round(base_val * factor, 3)
+        results[sli] = baseline
+    return results
+
+
+@_ttl_cached(_HEALTH_TTL_S)
 @track_dd_query
 def fetch_current_health(
     service: str,
@@ -124,26 +255,94 @@ def fetch_current_health(
     Fetch current (post-deploy) value for an SLI.
     Returns current value + whether it is anomalous vs baseline.
     """
-    if _is_live_mode():
-        return _fetch_current_health_live(service, sli, post_deploy_minutes)
+    return _current_health(service, [sli], post_deploy_minutes)[sli]
+
+
+@_ttl_cached(_HEALTH_TTL_S)
+@track_dd_query
+def fetch_current_health_batch(
+    service: str,
+    slis: list[str],
+    post_deploy_minutes: int = DEFAULT_POST_DEPLOY_MINUTES,
+) -> dict[str, dict[str, Any]]:
+    """
+    Fetch current (post-deploy) health for several SLIs of one service.
+
+    Returns {sli: health} with the same shape as fetch_current_health.
+    """
+    return _current_health(service, slis, post_deploy_minutes)
+
+
+def _current_health_demo(
+    service: str,
+    slis: list[str],
+    post_deploy_minutes: int,
+) -> dict[str, dict[str, Any]]:
+    """Demo mode: simulate slight perturbation from baseline."""
+    baselines = _load_revert_history().get("baselines", {}).get(service, {})
+    results = {}
+    for sli in slis:
+        base_val = baselines.get(sli, 0)
+        # Random perturbation: sometimes normal, sometimes elevated
+        jitter = random.uniform(0.85, 1.6)
+        current_val = round(base_val * jitter, 3)
+        is_anomalous = jitter > 1.35
+        results[sli] = {
+            "sli": sli,
+            "service": service,
+            "current_value": current_val,
+            "baseline_avg": round(base_val, 3),
+            "deviation_pct": round((jitter - 1.0) * 100, 1),
+            "is_anomalous": is_anomalous,
+            "window_minutes": post_deploy_minutes,
+        }
+    return results
 
-    # ── Demo mode: simulate slight perturbation from baseline ──
-    data = _load_revert_history()
-    baselines = data.get("baselines", {}).get(service, {})
-    base_val = baselines.get(sli, 0)
-    # Random perturbation: sometimes normal, sometimes elevated
-    jitter = random.uniform(0.85, 1.6)
-    current_val = round(base_val * jitter, 3)
-    is_anomalous = jitter > 1.35
-    return {
-        "sli": sli,
-        "service": service,
-        "current_value": current_val,
-        "baseline_avg": round(base_val, 3),
-        "deviation_pct": round((jitter - 1.0) * 100, 1),
-        "is_anomalous": is_anomalous,
-        "window_minutes": post_deploy_minutes,
-    }
+
+# Upper bound on live Datadog requests in flight for one assessment
+_ASSESSMENT_WORKERS = 8
+
+
+def fetch_all_for_assessment(
+    service: str,
+    platform: str | None = None,
+    window_days: int = DEFAULT_HISTORY_WINDOW_DAYS,
+    post_deploy_minutes: int = DEFAULT_POST_DEPLOY_MINUTES,
+) -> dict[str, Any]:
+    """
+    Fetch everything a risk assessment needs from Datadog in one go.
+
+    Returns a dict with:
+        revert_events   – fetch_revert_events(service, platform, window_days)
+        baselines       – {sli: baseline} for KEY_SLIS
+        current_health  – {sli: health} for KEY_SLIS
+
+    In live mode the three requests are independent and network-bound, so
+    they run concurrently on the shared (urllib3-pooled, thread-safe)
+    ApiClient; each call still goes through @track_dd_query.
+    """
+    if not _IS_LIVE:
+        return {
+            "revert_events": fetch_revert_events(service, platform, window_days),
+            "baselines": fetch_metric_baselines_batch(service, KEY_SLIS, window_days),
+            "current_health": fetch_current_health_batch(service, KEY_SLIS, post_deploy_minutes),
+        }
+
+    with ThreadPoolExecutor(max_workers=_ASSESSMENT_WORKERS) as executor:
+        revert_events = submit_in_context(
+            executor, fetch_revert_events, service, platform, window_days,
+        )
+        baselines = submit_in_context(
+            executor, fetch_metric_baselines_batch, service, KEY_SLIS, window_days,
+        )
+        current_health = submit_in_context(
+            executor, fetch_current_health_batch, service, KEY_SLIS, post_deploy_minutes,
+        )
+        return {
+            "revert_events": revert_events.result(),
+            "baselines": baselines.result(),
+            "current_health": current_health.result(),
+        }
 
 
 @track_dd_query
@@ -157,6 +356,57 @@ def fetch_all_baselines(service: str) -> dict[str, float]:
 # Live Datadog API calls (production mode)
 # ──────────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _get_api_client():
+    """Return a shared ApiClient so live queries reuse pooled connections."""
+    from datadog_api_client import Configuration, ApiClient
+
+    config = Configuration()
+    config.api_key["apiKeyAuth"] = DD_API_KEY
+    config.api_key["appKeyAuth"] = DD_APP_KEY
+    config.server_variables["site"] = DD_SITE
+
+    api_client = ApiClient(config)
+    atexit.register(api_client.close)
+    return api_client
+
+
+# Runs the 30-day baseline query that current health overlaps with its own
+# query. Shared rather than per call, since health is fetched from inside the
+# assessment pool on every run.
+_HEALTH_BASELINE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_ASSESSMENT_WORKERS,
+    thread_name_prefix="dd-health-baseline",
+)
+
+
+def _point_values_by_metric(response) -> dict[str, list[float]]:
+    """Non-null values from a query_metrics response, grouped by series metric name.
+
+    Points are [timestamp_ms, value]; a comma-separated multi-query returns
+    one series per sub-query, each tagged with its metric.
+    """
+    values: dict[str, list[float]] = {}
+    for series in (response.series or []):
+        bucket = values.setdefault(series.metric, [])
+        bucket.extend(
+            pt.value[1]
+            for pt in (series.pointlist or [])
+            if pt.value and pt.value[1] is not None
+        )
+    return values
+
+
+def _query_slis(service: str, slis: list[str], start: int, end: int) -> dict[str, list[float]]:
+    """Query every SLI of a service in one multi-query round-trip."""
+    from datadog_api_client.v1.api.metrics_api import MetricsApi
+
+    api = MetricsApi(_get_api_client())
+    query = ",".join(f"avg:{sli}{{service:{service}}}" for sli in slis)
+    response = api.query_metrics(_from=start, to=end, query=query)
+    return _point_values_by_metric(response)
+
+
 def _fetch_revert_events_live(
     service: str,
     platform: str | None,
@@ -164,147 +414,154 @@ def _fetch_revert_events_live(
 ) -> list[dict]:
     """Query Datadog Events API for rollback/revert events."""
     try:
-        from datadog_api_client import Configuration, ApiClient
         from datadog_api_client.v1.api.events_api import EventsApi
 
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = DD_API_KEY
-        config.api_key["appKeyAuth"] = DD_APP_KEY
-        config.server_variables["site"] = DD_SITE
-
         now = int(time.time())
         start = now - (window_days * 86400)
 
-        with ApiClient(config) as api_client:
-            api = EventsApi(api_client)
-            tags_filter = f"service:{service}"
-            if platform:
-                tags_filter += f",platform:{platform}"
-            response = api.list_events(
-                start=start,
-                end=now,
-                tags=tags_filter,
-                sources="rollback,revert,deploy",
-            )
-            events = []
-            for ev in (response.events or []):
-                events.append({
-                    "id": str(ev.id),
-                    "date": str(ev.date_happened),
-                    "feature": ev.title or "",
-                    "service": service,
-                    "platform": platform or "all",
-                    "description": ev.text or "",
-                    "trigger": "datadog_event",
-                    "tags": ev.tags or [],
-                })
-            return events
+        api_client = _get_api_client()
+        api = EventsApi(api_client)
+        tags_filter = f"service:{service}"
+        if platform:
+            tags_filter += f",platform:{platform}"
+        response = api.list_events(
+            start=start,
+            end=now,
+            tags=tags_filter,
+            sources="rollback,revert,deploy",
+        )
+        events = []
+        for ev in (response.events or []):
+            events.append({
+                "id": str(ev.id),
+                "date": str(ev.date_happened),
+                "feature": ev.title or "",
+                "service": service,
+                "platform": platform or "all",
+                "description": ev.text or "",
+                "trigger": "datadog_event",
+                "tags": ev.tags or [],
+            })
+        return events
     except Exception as e:
-        print(f"[DatadogClient] Live event fetch failed: {e}")
+        log_sampled(logging.WARNING, f"[DatadogClient] Live event fetch failed: {e}")
+        _mark_fetch_degraded()
         return []
 
 
-def _fetch_metric_baseline_live(
+def _fetch_metric_baselines_live_batch(
     service: str,
-    sli: str,
+    slis: list[str],
     window_days: int,
-) -> dict:
-    """Query Datadog Metrics API for baseline values."""
-    try:
-        from datadog_api_client import Configuration, ApiClient
-        from datadog_api_client.v1.api.metrics_api import MetricsApi
+) -> dict[str, dict]:
+    """Query Datadog Metrics API for baseline values of several SLIs at once."""
+    baselines, ok = _live_baselines(service, slis, window_days)
+    if not ok:
+        _mark_fetch_degraded()
+    return baselines
 
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = DD_API_KEY
-        config.api_key["appKeyAuth"] = DD_APP_KEY
-        config.server_variables["site"] = DD_SITE
 
+def _live_baselines(
+    service: str,
+    slis: list[str],
+    window_days: int,
+) -> tuple[dict[str, dict], bool]:
+    """Baselines for several SLIs, and whether the query succeeded (zeros if not)."""
+    try:
         now = int(time.time())
         start = now - (window_days * 86400)
-
-        with ApiClient(config) as api_client:
-            api = MetricsApi(api_client)
-            query = f"avg:{sli}{{service:{service}}}"
-            response = api.query_metrics(
-                _from=start,
-                to=now,
-                query=query,
-            )
-            points = []
-            for series in (response.series or []):
-                for pt in (series.pointlist or []):
-                    if pt.value is not None:
-                        points.append(pt.value)
-            if points:
-                import statistics
-                avg = statistics.mean(points)
-                return {
-                    "sli": sli,
-                    "service": service,
-                    "window_days": window_days,
-                    "avg": round(avg, 3),
-                    "p95": round(sorted(points)[int(len(points) * 0.95)], 3),
-                    "p99": round(sorted(points)[int(len(points) * 0.99)], 3),
-                    "stddev": round(statistics.stdev(points) if len(points) > 1 else 0, 3),
-                }
-            return {"sli": sli, "service": service, "avg": 0, "p95": 0, "p99": 0, "stddev": 0}
+        values = _query_slis(service, slis, start, now)
+        ok = True
     except Exception as e:
-        print(f"[DatadogClient] Live metric fetch failed: {e}")
-        return {"sli": sli, "service": service, "avg": 0, "p95": 0, "p99": 0, "stddev": 0}
+        log_sampled(logging.WARNING, f"[DatadogClient] Live metric fetch failed: {e}")
+        values = {}
+        ok = False
+    return {sli: _baseline_from_points(service, sli, window_days, values.get(sli)) for sli in slis}, ok
 
 
-def _fetch_current_health_live(
+def _baseline_from_points(
     service: str,
     sli: str,
-    post_deploy_minutes: int,
+    window_days: int,
+    points: list[float] | None,
 ) -> dict:
-    """Query Datadog for current metric health."""
-    baseline = _fetch_metric_baseline_live(service, sli, 30)
+    if points:
+        avg = statistics.mean(points)
+        ordered = sorted(points)
+        n = len(ordered)
+        return {
+            "sli": sli,
+            "service": service,
+            "window_days": window_days,
+            "avg": round(avg, 3),
+            "p95": round(ordered[int(n * 0.95)], 3),
+            "p99": round(ordered[int(n * 0.99)], 3),
+            "stddev": round(statistics.stdev(points) if len(points) > 1 else 0, 3),
+        }
+    return {"sli": sli, "service": service, "avg": 0, "p95": 0, "p99": 0, "stddev": 0}
+
+
+def _fetch_current_health_live_batch(
+    service: str,
+    slis: list[str],
+    post_deploy_minutes: int,
+) -> dict[str, dict]:
+    """Query Datadog for current metric health of several SLIs at once."""
+    # The 30-day baseline and the post-deploy window are independent queries;
+    # overlap them so current health costs one round-trip instead of two.
+    baselines_future = submit_in_context(_HEALTH_BASELINE_EXECUTOR, _live_baselines, service, slis, 30)
     try:
-        from datadog_api_client import Configuration, ApiClient
-        from datadog_api_client.v1.api.metrics_api import MetricsApi
-
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = DD_API_KEY
-        config.api_key["appKeyAuth"] = DD_APP_KEY
-        config.server_variables["site"] = DD_SITE
-
         now = int(time.time())
         start = now - (post_deploy_minutes * 60)
-
-        with ApiClient(config) as api_client:
-            api = MetricsApi(api_client)
-            query = f"avg:{sli}{{service:{service}}}"
-            response = api.query_metrics(_from=start, to=now, query=query)
-            points = []
-            for series in (response.series or []):
-                for pt in (series.pointlist or []):
-                    if pt.value is not None:
-                        points.append(pt.value)
-            if points:
-                import statistics
-                current = statistics.mean(points)
-                base_avg = baseline.get("avg", 1) or 1
-                deviation = ((current - base_avg) / base_avg) * 100
-                return {
-                    "sli": sli,
-                    "service": service,
-                    "current_value": round(current, 3),
-                    "baseline_avg": round(base_avg, 3),
-                    "deviation_pct": round(deviation, 1),
-                    "is_anomalous": abs(deviation) > 35,
-                    "window_minutes": post_deploy_minutes,
-                }
+        values = _query_slis(service, slis, start, now)
+        ok = True
     except Exception as e:
-        print(f"[DatadogClient] Live health fetch failed: {e}")
-
-    return {
-        "sli": sli,
-        "service": service,
-        "current_value": 0,
-        "baseline_avg": baseline.get("avg", 0),
-        "deviation_pct": 0,
-        "is_anomalous": False,
-        "window_minutes": post_deploy_minutes,
-    }
+        log_sampled(logging.WARNING, f"[DatadogClient] Live health fetch failed: {e}")
+        values = {}
+        ok = False
+    baselines, baselines_ok = baselines_future.result()
+    if not (ok and baselines_ok):
+        _mark_fetch_degraded()
+
+    results = {}
+    for sli in slis:
+        baseline = baselines[sli]
+        points = values.get(sli)
+        if points:
+            current = statistics.mean(points)
+            base_avg = baseline.get("avg", 1) or 1
+            deviation = ((current - base_avg) / base_avg) * 100
+            results[sli] = {
+                "sli": sli,
+                "service": service,
+                "current_value": round(current, 3),
+                "baseline_avg": round(base_avg, 3),
+                "deviation_pct": round(deviation, 1),
+                "is_anomalous": abs(deviation) > 35,
+                "window_minutes": post_deploy_minutes,
+            }
+        else:
+            results[sli] = {
+                "sli": sli,
+                "service": service,
+                "current_value": 0,
+                "baseline_avg": baseline.get("avg", 0),
+                "deviation_pct": 0,
+                "is_anomalous": False,
+                "window_minutes": post_deploy_minutes,
+            }
+    return results
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Mode binding – resolved once at import instead of on every call
+# ──────────────────────────────────────────────────────────────────────
 
+if _IS_LIVE:
+    _revert_events = _fetch_revert_events_live
+    _metric_baselines = _fetch_metric_baselines_live_batch
+    _current_health = _fetch_current_health_live_batch
+else:
+    _revert_events = _fetch_revert_events_demo
+    _metric_baselines = _metric_baselines_demo
+    _current_health = _current_health_demo
@@ -21,22 +21,26 @@ Usage:
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from agent.config import KEY_SLIS, EVALS_DIR, DEFAULT_HISTORY_WINDOW_DAYS
+import orjson
+
+from agent.config import EVALS_DIR, DEFAULT_HISTORY_WINDOW_DAYS
 from agent.datadog_client import (
     fetch_revert_events,
-    fetch_metric_baseline,
-    fetch_current_health,
-    fetch_all_baselines,
+    fetch_all_for_assessment,
 )
-from agent.signature_builder import build_signatures, rank_signatures
+from agent.signature_builder import build_signatures, is_sli_elevated, rank_signatures
 from agent.risk_model import compute_risk
 from agent.bedrock_summarizer import generate_report
-from agent.observability import start_run, logger
+from agent.observability import start_run, logger, utc_iso
+
+# Eval files are written off the request path; one worker keeps writes ordered
+_eval_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eval-writer")
+atexit.register(_eval_executor.shutdown, wait=True)
 
 
 def run_agent(
@@ -75,11 +79,14 @@ def run_agent(
     try:
         # ── Step 1: Fetch historical revert events ──
         logger.info(f"[{run_ctx.run_id}] Step 1: Fetching revert history for {service}...")
-        revert_events = fetch_revert_events(
+        # Revert history, baselines and current health are independent; fetch together
+        datadog_data = fetch_all_for_assessment(
             service=service,
             platform=platform,
             window_days=time_window_days,
+            post_deploy_minutes=post_deploy_minutes,
         )
+        revert_events = datadog_data["revert_events"]
         logger.info(f"[{run_ctx.run_id}] Found {len(revert_events)} revert events")
 
         # If no events for this exact service, broaden search
@@ -102,21 +109,24 @@ def run_agent(
         run_ctx.signatures_matched = len(signatures)
         logger.info(f"[{run_ctx.run_id}] Built {len(signatures)} signatures")
 
-        # ── Step 3: Fetch current SLI baselines ──
-        logger.info(f"[{run_ctx.run_id}] Step 3: Fetching SLI baselines for {service}...")
-        sli_baselines: dict[str, dict[str, Any]] = {}
-        for sli in KEY_SLIS:
-            baseline = fetch_metric_baseline(service, sli, time_window_days)
-            if baseline.get("avg", 0) > 0:  # Only include non-zero SLIs
-                sli_baselines[sli] = baseline
+        # ── Step 3: Collect current SLI baselines ──
+        logger.info(f"[{run_ctx.run_id}] Step 3: Collecting SLI baselines for {service}...")
+        sli_baselines: dict[str, dict[str, Any]] = {
+            sli: baseline
+            for sli, baseline in datadog_data["baselines"].items()
+            if baseline.get("avg", 0) > 0  # Only include non-zero SLIs
+        }
 
-        # ── Step 4: Fetch current health ──
-        logger.info(f"[{run_ctx.run_id}] Step 4: Fetching current health...")
+        # ── Step 4: Collect current health ──
+        logger.info(f"[{run_ctx.run_id}] Step 4: Collecting current health...")
+        # Classify for similarity in the same pass so ranking needn't rescan
         sli_current_health: dict[str, dict[str, Any]] = {}
-        for sli in KEY_SLIS:
-            health = fetch_current_health(service, sli, post_deploy_minutes)
+        elevated_slis: list[str] = []
+        for sli, health in datadog_data["current_health"].items():
             if health.get("baseline_avg", 0) > 0:
                 sli_current_health[sli] = health
+                if is_sli_elevated(health):
+                    elevated_slis.append(sli)
 
         # ── Step 5: Rank signatures by similarity ──
         logger.info(f"[{run_ctx.run_id}] Step 5: Ranking signatures by similarity...")
@@ -126,6 +136,7 @@ def run_agent(
             current_platform=platform,
             current_tags=tags,
             current_sli_health=sli_current_health,
+            current_elevated_slis=elevated_slis,
         )
 
         # ── Step 6: Compute risk score ──
@@ -148,12 +159,14 @@ def run_agent(
         )
 
         # Add run metadata
-        report["run_id"] = run_ctx.run_id
-        report["timestamp"] = datetime.now(timezone.utc).isoformat()
-        report["agent_metrics"] = {
-            "latency_ms": run_ctx.latency_ms,
-            "dd_query_count": run_ctx.dd_query_count,
-            "signatures_matched": run_ctx.signatures_matched,
+        report |= {
+            "run_id": run_ctx.run_id,
+            "timestamp": utc_iso(),
+            "agent_metrics": {
+                "latency_ms": run_ctx.latency_ms,
+                "dd_query_count": run_ctx.dd_query_count,
+                "signatures_matched": run_ctx.signatures_matched,
+            },
         }
 
         # ── Finish observability ──
@@ -176,10 +189,24 @@ def run_agent(
 
 
 def _save_eval(report: dict, run_id: str) -> None:
-    """Persist the run output for evaluation/audit."""
-    EVALS_DIR.mkdir(parents=True, exist_ok=True)
-    path = EVALS_DIR / f"run_{run_id}.json"
-    with open(path, "w") as f:
-        json.dump(report, f, indent=2, default=str)
-    logger.info(f"[Eval] Saved to {path}")
+    """
+    Persist the run output for evaluation/audit.
+
+    The report is serialized here, so callers may keep mutating it; the
+    disk write happens on the background eval writer.
+    """
+    payload = orjson.dumps(
+        report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str,
+    )
+    _eval_executor.submit(_write_eval, payload, run_id)
+
+
+def _write_eval(payload: bytes, run_id: str) -> None:
+    try:
+        EVALS_DIR.mkdir(parents=True, exist_ok=True)
+        path = EVALS_DIR / f"run_{run_id}.json"
+        path.write_bytes(payload)
+        logger.info(f"[Eval] Saved to {path}")
+    except Exception as e:
+        logger.warning(f"[Eval] Could not save run {run_id}: {e}")
 
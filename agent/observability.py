@@ -10,15 +10,33 @@ This satisfies the "Observability for AI" hackathon requirement.
 
 from __future__ import annotations
 
+import atexit
+import contextvars
 import functools
+import inspect
 import json
 import logging
+import secrets
+import threading
 import time
-import uuid
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable
 
-from agent.config import DD_API_KEY, DD_SITE, AGENT_ENV
+import orjson
+
+from agent.config import DD_API_KEY, DD_SITE, AGENT_ENV, AGENT_JSON_LOGS
+
+_UTC = timezone.utc
+
+
+def utc_iso(ts: float | None = None) -> str:
+    """ISO-8601 UTC timestamp for epoch seconds ``ts`` (the current time if omitted)."""
+    return datetime.fromtimestamp(time.time() if ts is None else ts, _UTC).isoformat()
+
 
 # ── Structured logger ──
 logger = logging.getLogger("revert_risk_advisor")
@@ -31,18 +49,52 @@ if not logger.handlers:
     logger.addHandler(handler)
 
 
+# Identical log lines from log_sampled are emitted at most once per window
+_LOG_SAMPLE_WINDOW_S = 60
+_LOG_SAMPLE_MAX_KEYS = 128
+_log_sample_last: dict[tuple[int, str], float] = {}
+_log_sample_lock = threading.Lock()
+
+
+def log_sampled(level: int, message: str) -> None:
+    """
+    Log ``message`` unless the same (level, message) was logged within the
+    last _LOG_SAMPLE_WINDOW_S seconds.
+
+    For error paths that can fire in bursts (throttling, an unreachable
+    Datadog), so one failure mode doesn't flood the log.
+    """
+    key = (level, message)
+    now = time.monotonic()
+    with _log_sample_lock:
+        last = _log_sample_last.pop(key, None)
+        if last is not None and now - last < _LOG_SAMPLE_WINDOW_S:
+            _log_sample_last[key] = last
+            return
+        if len(_log_sample_last) >= _LOG_SAMPLE_MAX_KEYS:
+            # Oldest entry first (dict insertion order)
+            del _log_sample_last[next(iter(_log_sample_last))]
+        _log_sample_last[key] = now
+    logger.log(level, message)
+
+
 # ──────────────────────────────────────────────────────────────────────
 # In-memory telemetry store (per-process; reset on restart)
 # ──────────────────────────────────────────────────────────────────────
 
-_telemetry: dict[str, list[dict]] = {
-    "runs": [],
-    "dd_queries": [],
+# Bounded ring buffers so a long-running server keeps constant memory;
+# the oldest records are dropped first.
+_MAX_RUN_RECORDS = 10_000
+_MAX_DD_QUERY_RECORDS = 100_000
+
+_telemetry: dict[str, deque[dict]] = {
+    "runs": deque(maxlen=_MAX_RUN_RECORDS),
+    "dd_queries": deque(maxlen=_MAX_DD_QUERY_RECORDS),
 }
 
 
-def get_telemetry() -> dict[str, list[dict]]:
-    """Return collected telemetry data."""
+def get_telemetry() -> dict[str, deque[dict]]:
+    """Return collected telemetry data (most recent last; deques do not support slicing)."""
     return _telemetry
 
 
@@ -55,20 +107,22 @@ def reset_telemetry() -> None:
 # Run-level tracking
 # ──────────────────────────────────────────────────────────────────────
 
+@dataclass(slots=True)
 class RunContext:
     """Captures metadata for a single agent run."""
 
-    def __init__(self, inputs: dict[str, Any]):
-        self.run_id = str(uuid.uuid4())[:12]
-        self.inputs = inputs
-        self.start_time = time.time()
-        self.end_time: float | None = None
-        self.dd_query_count = 0
-        self.signatures_matched = 0
-        self.risk_score: int | None = None
-        self.recommendation: str | None = None
+    inputs: dict[str, Any]
+    run_id: str = field(default_factory=lambda: secrets.token_hex(6))
+    start_time: float = field(default_factory=time.time)
+    end_time: float | None = None
+    dd_query_count: int = 0
+    bedrock_throttle_count: int = 0
+    signatures_matched: int = 0
+    risk_score: int | None = None
+    recommendation: str | None = None
 
     def finish(self, risk_score: int, recommendation: str, evidence: list[str] | None = None):
+        # One clock reading for latency, the record timestamp and the metric points
         self.end_time = time.time()
         self.risk_score = risk_score
         self.recommendation = recommendation
@@ -76,7 +130,7 @@ class RunContext:
         record["evidence"] = evidence or []
         _telemetry["runs"].append(record)
         _emit_structured_log(record)
-        _emit_metrics(record)
+        _emit_metrics(record, self.end_time)
 
     @property
     def latency_ms(self) -> float:
@@ -86,29 +140,42 @@ class RunContext:
     def _to_dict(self) -> dict[str, Any]:
         return {
             "run_id": self.run_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso(self.end_time),
             "inputs": self.inputs,
             "latency_ms": self.latency_ms,
             "dd_query_count": self.dd_query_count,
+            "bedrock_throttle_count": self.bedrock_throttle_count,
             "signatures_matched": self.signatures_matched,
             "risk_score": self.risk_score,
             "recommendation": self.recommendation,
         }
 
 
-# Global per-request context
-_current_run: RunContext | None = None
+# Per-request context: each thread / asyncio task sees the run it started,
+# so concurrent runs don't overwrite each other.
+_current_run: ContextVar[RunContext | None] = ContextVar("current_run", default=None)
+# Guards RunContext counters, which worker threads update concurrently
+_run_counter_lock = threading.Lock()
 
 
 def start_run(inputs: dict[str, Any]) -> RunContext:
-    global _current_run
-    _current_run = RunContext(inputs)
-    logger.info(f"[RUN {_current_run.run_id}] Started | inputs={json.dumps(inputs)}")
-    return _current_run
+    run_ctx = RunContext(inputs)
+    _current_run.set(run_ctx)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"[RUN {run_ctx.run_id}] Started | inputs={json.dumps(inputs)}")
+    return run_ctx
 
 
 def current_run() -> RunContext | None:
-    return _current_run
+    return _current_run.get()
+
+
+def submit_in_context(executor: Executor, fn: Callable, /, *args, **kwargs) -> Future:
+    """
+    executor.submit() that runs ``fn`` in a copy of the caller's context, so
+    work on pool threads is still attributed to the caller's run.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -118,35 +185,65 @@ def current_run() -> RunContext | None:
 def track_dd_query(fn: Callable) -> Callable:
     """Decorator that counts Datadog queries for the current run."""
 
-    @functools.wraps(fn)
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        result = fn(*args, **kwargs)
-        elapsed = round((time.time() - start) * 1000, 1)
+    def record(start: float) -> None:
+        end = time.time()
+        elapsed = round((end - start) * 1000, 1)
 
+        run_ctx = _current_run.get()
         query_record = {
             "function": fn.__name__,
             "latency_ms": elapsed,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "run_id": _current_run.run_id if _current_run else None,
+            "timestamp": utc_iso(end),
+            "run_id": run_ctx.run_id if run_ctx else None,
         }
         _telemetry["dd_queries"].append(query_record)
 
-        if _current_run:
-            _current_run.dd_query_count += 1
+        if run_ctx:
+            with _run_counter_lock:
+                run_ctx.dd_query_count += 1
+
+        logger.debug("[DD Query] %s completed in %sms", fn.__name__, elapsed)
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            start = time.time()
+            result = await fn(*args, **kwargs)
+            record(start)
+            return result
 
-        logger.debug(f"[DD Query] {fn.__name__} completed in {elapsed}ms")
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.time()
+        result = fn(*args, **kwargs)
+        record(start)
         return result
 
     return wrapper
 
 
+def record_bedrock_throttle(error_code: str) -> None:
+    """Count a Bedrock call that still failed with a throttling/availability error after retries."""
+    run_ctx = _current_run.get()
+    if run_ctx:
+        with _run_counter_lock:
+            run_ctx.bedrock_throttle_count += 1
+    logger.warning(
+        f"[Bedrock] Throttled after retries | code={error_code} "
+        f"run_id={run_ctx.run_id if run_ctx else None}"
+    )
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Emission helpers
 # ──────────────────────────────────────────────────────────────────────
 
 def _emit_structured_log(record: dict[str, Any]) -> None:
     """Emit a structured JSON log line for the agent run."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         f"[RUN {record['run_id']}] Completed | "
         f"risk={record['risk_score']} "
@@ -156,69 +253,109 @@ def _emit_structured_log(record: dict[str, Any]) -> None:
         f"signatures_matched={record['signatures_matched']}"
     )
     # Full JSON for log aggregation
-    logger.info(json.dumps(record, default=str))
+    if AGENT_JSON_LOGS:
+        logger.info(orjson.dumps(record, default=str).decode())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_metrics_client():
+    """Return a shared ApiClient for metric submission, so runs reuse one pooled connection."""
+    from datadog_api_client import Configuration, ApiClient
+
+    config = Configuration()
+    config.api_key["apiKeyAuth"] = DD_API_KEY
+    config.server_variables["site"] = DD_SITE
+
+    # Closed by _shutdown_metrics after the final flush
+    return ApiClient(config)
+
+
+# Run metrics are buffered and submitted together: when this many runs are
+# pending, or every _METRIC_FLUSH_INTERVAL_S from a background thread.
+_METRIC_FLUSH_SIZE = 50
+_METRIC_FLUSH_INTERVAL_S = 10
+_metric_buffer: list[tuple[int, dict[str, Any]]] = []
+_metric_lock = threading.Lock()
+_metric_flusher: threading.Thread | None = None
+
+# (metric name, intake type, record key) for each per-run metric
+_RUN_METRICS = (
+    ("agent.run.count", "COUNT", None),
+    ("agent.run.latency_ms", "GAUGE", "latency_ms"),
+    ("agent.datadog_queries.count", "COUNT", "dd_query_count"),
+    ("agent.bedrock.throttled.count", "COUNT", "bedrock_throttle_count"),
+    ("agent.revert_signatures.matched", "GAUGE", "signatures_matched"),
+    ("agent.risk_score", "GAUGE", "risk_score"),
+)
 
 
-def _emit_metrics(record: dict[str, Any]) -> None:
+def _emit_metrics(record: dict[str, Any], ts: float) -> None:
     """
-    Send custom metrics to Datadog (if API key is configured).
+    Queue custom metrics for Datadog (if API key is configured), stamped
+    with the run's end time ``ts``.
     In demo mode, this is a no-op — metrics stay in-memory only.
     """
     if AGENT_ENV == "demo" or not DD_API_KEY:
         return
 
+    global _metric_flusher
+    with _metric_lock:
+        _metric_buffer.append((int(ts), record))
+        flush_now = len(_metric_buffer) >= _METRIC_FLUSH_SIZE
+        if _metric_flusher is None:
+            _metric_flusher = threading.Thread(
+                target=_flush_metrics_loop, name="metrics-flusher", daemon=True,
+            )
+            _metric_flusher.start()
+            atexit.register(_shutdown_metrics)
+    if flush_now:
+        _flush_metrics()
+
+
+def _flush_metrics_loop() -> None:
+    while True:
+        time.sleep(_METRIC_FLUSH_INTERVAL_S)
+        _flush_metrics()
+
+
+def _shutdown_metrics() -> None:
+    """Flush pending runs at exit, then close the metrics client if one was built."""
+    _flush_metrics()
+    if _get_metrics_client.cache_info().currsize:
+        _get_metrics_client().close()
+
+
+def _flush_metrics() -> None:
+    """Submit every buffered run as one MetricPayload (one series per metric)."""
+    with _metric_lock:
+        batch = _metric_buffer[:]
+        _metric_buffer.clear()
+    if not batch:
+        return
+
     try:
-        from datadog_api_client import Configuration, ApiClient
         from datadog_api_client.v2.api.metrics_api import MetricsApi
         from datadog_api_client.v2.model.metric_intake_type import MetricIntakeType
         from datadog_api_client.v2.model.metric_payload import MetricPayload
         from datadog_api_client.v2.model.metric_point import MetricPoint
         from datadog_api_client.v2.model.metric_series import MetricSeries
 
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = DD_API_KEY
-        config.server_variables["site"] = DD_SITE
-
-        now = int(time.time())
         tags = [f"env:{AGENT_ENV}"]
-
         series = [
             MetricSeries(
-                metric="agent.run.count",
-                type=MetricIntakeType.COUNT,
-                points=[MetricPoint(timestamp=now, value=1)],
+                metric=metric,
+                type=getattr(MetricIntakeType, intake_type),
+                points=[
+                    MetricPoint(timestamp=ts, value=(record[key] or 0) if key else 1)
+                    for ts, record in batch
+                ],
                 tags=tags,
-            ),
-            MetricSeries(
-                metric="agent.run.latency_ms",
-                type=MetricIntakeType.GAUGE,
-                points=[MetricPoint(timestamp=now, value=record["latency_ms"])],
-                tags=tags,
-            ),
-            MetricSeries(
-                metric="agent.datadog_queries.count",
-                type=MetricIntakeType.COUNT,
-                points=[MetricPoint(timestamp=now, value=record["dd_query_count"])],
-                tags=tags,
-            ),
-            MetricSeries(
-                metric="agent.revert_signatures.matched",
-                type=MetricIntakeType.GAUGE,
-                points=[MetricPoint(timestamp=now, value=record["signatures_matched"])],
-                tags=tags,
-            ),
-            MetricSeries(
-                metric="agent.risk_score",
-                type=MetricIntakeType.GAUGE,
-                points=[MetricPoint(timestamp=now, value=record["risk_score"] or 0)],
-                tags=tags,
-            ),
+            )
+            for metric, intake_type, key in _RUN_METRICS
         ]
 
-        with ApiClient(config) as api_client:
-            api = MetricsApi(api_client)
-            api.submit_metrics(body=MetricPayload(series=series))
-            logger.info(f"[Observability] Metrics sent to Datadog for run {record['run_id']}")
+        api = MetricsApi(_get_metrics_client())
+        api.submit_metrics(body=MetricPayload(series=series))
+        logger.info(f"[Observability] Metrics sent to Datadog for {len(batch)} run(s)")
     except Exception as e:
-        logger.warning(f"[Observability] Failed to send metrics: {e}")
-
+        logger.warning(f"[Observability] Failed to send metrics for {len(batch)} run(s): {e}")
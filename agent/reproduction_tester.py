@@ -10,11 +10,34 @@ When a crash is identified as reproducible, this module:
 
 from __future__ import annotations
 
+import contextlib
+import re
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
 
-from agent.observability import logger
+from agent.config import SIMULATE_DELAYS
+from agent.observability import logger, utc_iso
+
+_URL_RE = re.compile(r'https?://[^\s]+')
+_CLICK_RE = re.compile(r'click\s+["\']([^"\']+)["\']', re.IGNORECASE)
+# Action steps mentioning these are treated as triggering the crash
+_CRASH_STEP_RE = re.compile(r"buffer|playback|process", re.IGNORECASE)
+# Console messages mentioning these count as a reproduced crash
+_CONSOLE_ERROR_RE = re.compile(r"error|exception", re.IGNORECASE)
+# Step keywords -> kind; lower kinds take precedence when a step matches several
+_STEP_KIND_RE = re.compile(r"navigate|go to|click|tap|start|play", re.IGNORECASE)
+_STEP_KINDS = {"navigate": 0, "go to": 0, "click": 1, "tap": 1, "start": 2, "play": 2}
+# Upper bound on steps run at once when test_reproduction(parallel_steps=True)
+_MAX_PARALLEL_STEPS = 8
+
+# Browser reproductions run on these long-lived threads, each reusing one
+# Chromium across tests (launching is the dominant cost) with a fresh context
+# per test. Browsers go away with the Playwright driver when the process exits.
+_MAX_BROWSERS = 4
+_browser_executor = ThreadPoolExecutor(max_workers=_MAX_BROWSERS, thread_name_prefix="playwright")
+_browser_local = threading.local()
 
 
 def test_reproduction(
@@ -22,6 +45,7 @@ def test_reproduction(
     reproduction_steps: list[str],
     environment: str = "alpha",  # "alpha" or "production"
     service: str | None = None,
+    parallel_steps: bool = False,
 ) -> dict[str, Any]:
     """
     Test if a crash is reproducible in the target environment.
@@ -41,6 +65,9 @@ def test_reproduction(
         reproduction_steps: Steps to reproduce the crash
         environment: Target environment (alpha/production)
         service: Service to test
+        parallel_steps: Steps are independent probes (e.g. per-platform
+            checks); run them concurrently. Results are still recorded in
+            step order and stop at the first step that hits the crash.
     
     Returns:
         Test result with:
@@ -64,45 +91,49 @@ def test_reproduction(
     }
     error_encountered = None
     reproduced = False
+    # Bound once; the step loop appends to these on every iteration
+    add_step = test_steps.append
+    add_log = evidence["logs"].append
+    add_screenshot = evidence["screenshots"].append
     
     try:
         # Execute reproduction steps
-        for i, step in enumerate(reproduction_steps, 1):
-            logger.info(f"Executing step {i}: {step}")
-            
-            step_result = _execute_step(step, environment, service)
-            test_steps.append({
-                "step_number": i,
-                "step_description": step,
-                "status": step_result.get("status", "unknown"),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "details": step_result.get("details", {}),
-            })
-            
-            # Check if crash/error occurred
-            if step_result.get("error_detected"):
-                reproduced = True
-                error_encountered = step_result.get("error_message", "Error detected")
-                evidence["logs"].append({
-                    "step": i,
-                    "error": error_encountered,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+        step_results = _iter_step_results(reproduction_steps, environment, service, parallel_steps)
+        with contextlib.closing(step_results):
+            for i, (step, step_result) in enumerate(zip(reproduction_steps, step_results), 1):
+                step_ts = utc_iso()
+                add_step({
+                    "step_number": i,
+                    "step_description": step,
+                    "status": step_result.get("status", "unknown"),
+                    "timestamp": step_ts,
+                    "details": step_result.get("details", {}),
                 })
-                logger.info(f"Crash reproduced at step {i}: {error_encountered}")
-                break
             
-            # Collect evidence
-            if step_result.get("screenshot"):
-                evidence["screenshots"].append({
-                    "step": i,
-                    "path": step_result["screenshot"],
-                })
+                # Check if crash/error occurred
+                if step_result.get("error_detected"):
+                    reproduced = True
+                    error_encountered = step_result.get("error_message", "Error detected")
+                    add_log({
+                        "step": i,
+                        "error": error_encountered,
+                        "timestamp": step_ts,
+                    })
+                    logger.info(f"Crash reproduced at step {i}: {error_encountered}")
+                    break
             
-            if step_result.get("log"):
-                evidence["logs"].append({
-                    "step": i,
-                    "log": step_result["log"],
-                })
+                # Collect evidence
+                if step_result.get("screenshot"):
+                    add_screenshot({
+                        "step": i,
+                        "path": step_result["screenshot"],
+                    })
+            
+                if step_result.get("log"):
+                    add_log({
+                        "step": i,
+                        "log": step_result["log"],
+                    })
         
         # If no crash during steps, check for post-step anomalies
         if not reproduced:
@@ -122,7 +153,7 @@ def test_reproduction(
             "test_steps_executed": test_steps,
             "error_encountered": error_encountered,
             "environment": environment,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso(),
         }
     
     except Exception as e:
@@ -134,10 +165,38 @@ def test_reproduction(
             "test_steps_executed": test_steps,
             "error_encountered": f"Test execution error: {e}",
             "environment": environment,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso(),
         }
 
 
+def _iter_step_results(
+    steps: list[str],
+    environment: str,
+    service: str | None,
+    parallel: bool,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield each step's result in step order.
+
+    With ``parallel`` every step is started up front on a thread pool;
+    closing the iterator early cancels the steps that haven't started.
+    """
+    if not parallel or len(steps) < 2:
+        for i, step in enumerate(steps, 1):
+            logger.info("Executing step %d: %s", i, step)
+            yield _execute_step(step, environment, service)
+        return
+
+    logger.info(f"Executing {len(steps)} steps in parallel")
+    executor = ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_STEPS, len(steps)))
+    try:
+        futures = [executor.submit(_execute_step, step, environment, service) for step in steps]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _execute_step(
     step_description: str,
     environment: str,
@@ -151,39 +210,39 @@ def _execute_step(
     - Use API clients for backend services
     - Use mobile testing frameworks for mobile apps
     """
-    # Parse step description to determine action type
-    step_lower = step_description.lower()
-    
-    if "navigate" in step_lower or "go to" in step_lower:
-        return _execute_navigation_step(step_description, environment)
-    
-    elif "click" in step_lower or "tap" in step_lower:
-        return _execute_interaction_step(step_description, environment)
-    
-    elif "start" in step_lower or "play" in step_lower:
-        return _execute_action_step(step_description, environment, service)
-    
-    else:
-        # Generic step - just log it
-        logger.info(f"Executing generic step: {step_description}")
-        return {
-            "status": "completed",
-            "details": {"step_type": "generic"},
-        }
+    # Classify the step in one regex pass; navigation beats interaction beats action
+    kinds = {_STEP_KINDS[kw.lower()] for kw in _STEP_KIND_RE.findall(step_description)}
+    handler = _STEP_HANDLERS[min(kinds)] if kinds else _execute_generic_step
+    return handler(step_description, environment, service)
+
+
+def _execute_generic_step(
+    step_description: str,
+    environment: str,
+    service: str | None = None,
+) -> dict[str, Any]:
+    """Execute a step with no recognised action - just log it."""
+    logger.info("Executing generic step: %s", step_description)
+    return {
+        "status": "completed",
+        "details": {"step_type": "generic"},
+    }
 
 
 def _execute_navigation_step(
     step_description: str,
     environment: str,
+    service: str | None = None,
 ) -> dict[str, Any]:
     """Execute a navigation step (e.g., navigate to URL)."""
     # Extract URL from step if present
     # In production, this would use Playwright or similar
     
-    logger.info(f"Navigating: {step_description}")
+    logger.info("Navigating: %s", step_description)
     
     # Simulate navigation delay
-    time.sleep(0.5)
+    if SIMULATE_DELAYS:
+        time.sleep(0.5)
     
     return {
         "status": "completed",
@@ -197,12 +256,14 @@ def _execute_navigation_step(
 def _execute_interaction_step(
     step_description: str,
     environment: str,
+    service: str | None = None,
 ) -> dict[str, Any]:
     """Execute an interaction step (e.g., click button)."""
-    logger.info(f"Interacting: {step_description}")
+    logger.info("Interacting: %s", step_description)
     
     # Simulate interaction delay
-    time.sleep(0.3)
+    if SIMULATE_DELAYS:
+        time.sleep(0.3)
     
     return {
         "status": "completed",
@@ -219,17 +280,15 @@ def _execute_action_step(
     service: str | None,
 ) -> dict[str, Any]:
     """Execute an action step (e.g., start playback)."""
-    logger.info(f"Performing action: {step_description}")
+    logger.info("Performing action: %s", step_description)
     
     # Simulate action delay
-    time.sleep(1.0)
+    if SIMULATE_DELAYS:
+        time.sleep(1.0)
     
     # Check if this action might trigger the crash
     # In production, this would monitor for errors/crashes
-    crash_keywords = ["buffer", "playback", "process"]
-    step_lower = step_description.lower()
-    
-    error_detected = any(keyword in step_lower for keyword in crash_keywords)
+    error_detected = _CRASH_STEP_RE.search(step_description) is not None
     
     return {
         "status": "completed",
@@ -243,6 +302,9 @@ def _execute_action_step(
     }
 
 
+_STEP_HANDLERS = (_execute_navigation_step, _execute_interaction_step, _execute_action_step)
+
+
 def _check_post_test_anomalies(
     service: str | None,
     environment: str,
@@ -254,7 +316,8 @@ def _check_post_test_anomalies(
     logger.info(f"Checking for anomalies in {environment} after test...")
     
     # Simulate check delay
-    time.sleep(0.5)
+    if SIMULATE_DELAYS:
+        time.sleep(0.5)
     
     # In demo mode, occasionally return anomaly
     import random
@@ -289,62 +352,20 @@ def test_web_reproduction(
     
     This uses Playwright to execute steps in a real browser.
     """
+    start_time = time.time()
+    evidence = {
+        "screenshots": [],
+        "logs": [],
+        "network_requests": [],
+    }
     try:
-        from playwright.sync_api import sync_playwright
-        
         logger.info(f"Starting browser-based reproduction test in {environment}...")
         
-        start_time = time.time()
-        evidence = {
-            "screenshots": [],
-            "logs": [],
-            "network_requests": [],
-        }
-        reproduced = False
-        error_encountered = None
-        
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context()
-            page = context.new_page()
-            
-            try:
-                for i, step in enumerate(reproduction_steps, 1):
-                    logger.info(f"Browser step {i}: {step}")
-                    
-                    # Parse and execute step
-                    if "navigate" in step.lower():
-                        url = _extract_url_from_step(step, base_url)
-                        page.goto(url, wait_until="networkidle")
-                        evidence["screenshots"].append({
-                            "step": i,
-                            "path": f"screenshots/step_{i}.png",
-                        })
-                        page.screenshot(path=f"screenshots/step_{i}.png")
-                    
-                    elif "click" in step.lower():
-                        element_text = _extract_element_from_step(step)
-                        page.click(f"text={element_text}", timeout=5000)
-                        time.sleep(1)  # Wait for action
-                    
-                    # Check for errors
-                    page_errors = page.evaluate("() => window.errors || []")
-                    if page_errors:
-                        reproduced = True
-                        error_encountered = str(page_errors)
-                        break
-                
-                # Final check for console errors
-                console_logs = []
-                page.on("console", lambda msg: console_logs.append(msg.text))
-                
-                if any("error" in log.lower() or "exception" in log.lower() for log in console_logs):
-                    reproduced = True
-                    error_encountered = "Console errors detected"
-                    evidence["logs"] = console_logs
-                
-            finally:
-                browser.close()
+        # Playwright objects are bound to the thread that created them, so
+        # the test runs on a long-lived browser thread rather than the caller's
+        reproduced, error_encountered = _browser_executor.submit(
+            _run_browser_steps, reproduction_steps, base_url, evidence,
+        ).result()
         
         return {
             "reproduced": reproduced,
@@ -352,7 +373,7 @@ def test_web_reproduction(
             "evidence": evidence,
             "error_encountered": error_encountered,
             "environment": environment,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso(),
         }
     
     except ImportError:
@@ -367,26 +388,91 @@ def test_web_reproduction(
             "evidence": evidence,
             "error_encountered": f"Browser test error: {e}",
             "environment": environment,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso(),
         }
 
 
+def _get_browser():
+    """Return this thread's Chromium browser, launching it on first use."""
+    browser = getattr(_browser_local, "browser", None)
+    if browser is None or not browser.is_connected():
+        if getattr(_browser_local, "playwright", None) is None:
+            from playwright.sync_api import sync_playwright
+            
+            _browser_local.playwright = sync_playwright().start()
+        browser = _browser_local.playwright.chromium.launch(headless=True)
+        _browser_local.browser = browser
+    return browser
+
+
+def _run_browser_steps(
+    reproduction_steps: list[str],
+    base_url: str,
+    evidence: dict[str, list],
+) -> tuple[bool, str | None]:
+    """Run the steps in a fresh context on this thread's browser; returns (reproduced, error)."""
+    reproduced = False
+    error_encountered = None
+    
+    context = _get_browser().new_context()
+    page = context.new_page()
+    # Listen from the start so output produced during the steps is captured;
+    # uncaught page errors arrive as events, with no evaluate() round-trip per step
+    console_logs: list[str] = []
+    page_errors: list[str] = []
+    page.on("console", lambda msg: console_logs.append(msg.text))
+    page.on("pageerror", lambda exc: page_errors.append(str(exc)))
+    
+    try:
+        for i, step in enumerate(reproduction_steps, 1):
+            logger.info("Browser step %d: %s", i, step)
+            
+            # Parse and execute step
+            if "navigate" in step.lower():
+                url = _extract_url_from_step(step, base_url)
+                page.goto(url, wait_until="networkidle")
+                evidence["screenshots"].append({
+                    "step": i,
+                    "path": f"screenshots/step_{i}.png",
+                })
+                page.screenshot(path=f"screenshots/step_{i}.png")
+            
+            elif "click" in step.lower():
+                element_text = _extract_element_from_step(step)
+                page.click(f"text={element_text}", timeout=5000)
+                time.sleep(1)  # Wait for action
+            
+            # Check for errors
+            if page_errors:
+                reproduced = True
+                error_encountered = str(page_errors)
+                break
+        
+        # Final check for console errors
+        if any(map(_CONSOLE_ERROR_RE.search, console_logs)):
+            reproduced = True
+            error_encountered = "Console errors detected"
+            evidence["logs"] = console_logs
+    
+    finally:
+        context.close()
+    
+    return reproduced, error_encountered
+
+
 def _extract_url_from_step(step: str, base_url: str) -> str:
     """Extract URL from step description."""
     # Simple extraction - in production, use more sophisticated parsing
-    if "http" in step:
-        import re
-        urls = re.findall(r'https?://[^\s]+', step)
-        if urls:
-            return urls[0]
+    match = _URL_RE.search(step)
+    if match:
+        return match.group(0)
     return base_url
 
 
 def _extract_element_from_step(step: str) -> str:
     """Extract element text/selector from step description."""
     # Extract text in quotes or after "click"
-    import re
-    match = re.search(r'click\s+["\']([^"\']+)["\']', step, re.IGNORECASE)
+    match = _CLICK_RE.search(step)
     if match:
         return match.group(1)
     return "button"  # Default
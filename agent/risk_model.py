@@ -15,13 +15,25 @@ Recommendation tiers:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Literal
 
 from agent.config import WEIGHT_SIMILARITY, WEIGHT_VOLATILITY, WEIGHT_ANOMALY
 from agent.signature_builder import RevertSignature
 
 
-@dataclass
+# Rollout guidance that doesn't depend on the assessment
+_SHIP_GUIDANCE = (
+    "Safe to proceed with standard rollout. "
+    "Continue monitoring key SLIs for 30 minutes post-deploy."
+)
+_RAMP_GUIDANCE = (
+    "Proceed with gradual ramp: 1% → 5% → 25% → 100%. "
+    "Hold at each stage for 15 minutes and validate SLIs. "
+    "Set automatic rollback triggers on anomalous metrics."
+)
+
+
+@dataclass(slots=True)
 class RiskAssessment:
     """Complete risk assessment for a release."""
 
@@ -44,9 +56,14 @@ def compute_risk(
     sli_current_health: dict[str, dict[str, Any]],
     service: str,
     platform: str | None = None,
+    detail: Literal["full", "summary"] = "full",
 ) -> RiskAssessment:
     """
     Compute the overall risk score and produce a full assessment.
+
+    ``detail="summary"`` returns only the scores and recommendation (text
+    and list fields left empty), for callers that score many releases and
+    don't read the rest.
     """
     # ── 1. Similarity component (0 – 50) ──
     if ranked_signatures:
@@ -61,21 +78,18 @@ def compute_risk(
     similarity_score = round(raw_similarity * WEIGHT_SIMILARITY, 1)
 
     # ── 2. Volatility component (0 – 30) ──
-    volatility_signals = []
+    # One pass: count tiers directly; only high-volatility names are reported
+    high_vol_slis = []
+    med_vol_count = 0
     for sli, baseline in sli_baselines.items():
-        stddev = baseline.get("stddev", 0)
-        avg = baseline.get("avg", 1) or 1
-        cv = stddev / avg  # coefficient of variation
+        cv = baseline.get("stddev", 0) / (baseline.get("avg", 1) or 1)  # coefficient of variation
         if cv > 0.3:
-            volatility_signals.append((sli, cv, "high"))
+            high_vol_slis.append(sli)
         elif cv > 0.15:
-            volatility_signals.append((sli, cv, "medium"))
-        else:
-            volatility_signals.append((sli, cv, "low"))
+            med_vol_count += 1
 
-    high_vol_count = sum(1 for _, _, level in volatility_signals if level == "high")
-    med_vol_count = sum(1 for _, _, level in volatility_signals if level == "medium")
-    total_slis = max(len(volatility_signals), 1)
+    high_vol_count = len(high_vol_slis)
+    total_slis = max(len(sli_baselines), 1)
     vol_ratio = (high_vol_count * 1.0 + med_vol_count * 0.5) / total_slis
     volatility_score = round(min(vol_ratio, 1.0) * WEIGHT_VOLATILITY, 1)
 
@@ -92,41 +106,51 @@ def compute_risk(
     anomaly_score = round(min(anomaly_ratio, 1.0) * WEIGHT_ANOMALY, 1)
 
     # ── Total risk score ──
-    risk_score = int(round(similarity_score + volatility_score + anomaly_score))
+    risk_score = round(similarity_score + volatility_score + anomaly_score)  # int without ndigits
     risk_score = max(0, min(100, risk_score))
 
     # ── Recommendation ──
     if risk_score <= 30:
         recommendation = "ship"
-        rollout_guidance = (
-            "Safe to proceed with standard rollout. "
-            "Continue monitoring key SLIs for 30 minutes post-deploy."
-        )
     elif risk_score <= 60:
         recommendation = "ramp"
-        rollout_guidance = (
-            f"Proceed with gradual ramp: 1% → 5% → 25% → 100%. "
-            f"Hold at each stage for 15 minutes and validate SLIs. "
-            f"Set automatic rollback triggers on anomalous metrics."
-        )
     else:
         recommendation = "hold"
+
+    if detail == "summary":
+        return RiskAssessment(
+            risk_score=risk_score,
+            recommendation=recommendation,
+            similarity_score=similarity_score,
+            volatility_score=volatility_score,
+            anomaly_score=anomaly_score,
+            top_risk_drivers=[],
+            matched_signatures=[],
+            monitoring_checks=[],
+            rollback_thresholds=[],
+            rollout_guidance="",
+        )
+
+    if recommendation == "ship":
+        rollout_guidance = _SHIP_GUIDANCE
+    elif recommendation == "ramp":
+        rollout_guidance = _RAMP_GUIDANCE
+    else:
         rollout_guidance = (
             f"Hold release until the following are validated: "
-            f"{''.join(anomalous_slis[:3]) or 'flagged SLIs'} return to baseline, "
+            f"{', '.join(anomalous_slis[:3]) or 'flagged SLIs'} return to baseline, "
             f"and the similarity to past rollback patterns is addressed. "
             f"Consider additional load testing before proceeding."
         )
 
     # ── Top risk drivers ──
     risk_drivers = _build_risk_drivers(
-        ranked_signatures, anomalous_slis, elevated_slis, volatility_signals
+        ranked_signatures, anomalous_slis, elevated_slis, high_vol_slis
     )
 
     # ── Matched signatures detail ──
-    matched_sigs = []
-    for sig, sim in ranked_signatures[:3]:
-        matched_sigs.append({
+    matched_sigs = [
+        {
             "revert_id": sig.revert_id,
             "date": sig.date,
             "feature": sig.feature,
@@ -136,9 +160,11 @@ def compute_risk(
             "severity": sig.severity_tier,
             "root_cause": sig.root_cause,
             "description": sig.description,
-            "impacted_slis": list(sig.sli_names),
+            "impacted_slis": list(sig.impacted_slis),  # keys in recorded order
             "max_spike_ratio": round(sig.max_spike_ratio, 1),
-        })
+        }
+        for sig, sim in ranked_signatures[:3]
+    ]
 
     # ── Monitoring checks & rollback thresholds ──
     monitoring_checks = _build_monitoring_checks(
@@ -175,7 +201,7 @@ def _build_risk_drivers(
     ranked_sigs: list[tuple[RevertSignature, float]],
     anomalous: list[str],
     elevated: list[str],
-    volatility: list[tuple[str, float, str]],
+    high_vol: list[str],
 ) -> list[str]:
     """Generate human-readable top risk drivers."""
     drivers = []
@@ -197,7 +223,6 @@ def _build_risk_drivers(
             f"Elevated (but not anomalous) metrics: {', '.join(elevated)}"
         )
 
-    high_vol = [sli for sli, _, level in volatility if level == "high"]
     if high_vol:
         drivers.append(
             f"High baseline volatility in: {', '.join(high_vol)} "
@@ -237,14 +262,16 @@ def _build_monitoring_checks(
             f"(baseline avg: {bl.get('avg', '?')})"
         )
 
-    # Add SLIs from top matched signatures
-    sig_slis = set()
+    # Add SLIs from top matched signatures, in signature order; one set tracks
+    # what's already covered
+    covered = set(anomalous).union(elevated)
     for sig, _ in ranked_sigs[:2]:
-        sig_slis |= sig.sli_names
-    for sli in sig_slis - set(anomalous) - set(elevated):
-        checks.append(
-            f"WATCH: Monitor {sli} — impacted in similar past rollback"
-        )
+        for sli in sig.impacted_slis:
+            if sli not in covered:
+                covered.add(sli)
+                checks.append(
+                    f"WATCH: Monitor {sli} — impacted in similar past rollback"
+                )
 
     if not checks:
         checks.append("Standard monitoring: all key SLIs within normal range")
@@ -267,7 +294,8 @@ def _build_rollback_thresholds(
         # Warning at p99
         warn_at = round(p99, 2)
 
-        current = current_health.get(sli, {}).get("current_value", avg)
+        health = current_health.get(sli)
+        current = health.get("current_value", avg) if health else avg
 
         thresholds.append({
             "sli": sli,
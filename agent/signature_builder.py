@@ -12,11 +12,14 @@ A signature captures:
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import operator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class RevertSignature:
     """Fingerprint of a single historical rollback event."""
 
@@ -32,42 +35,75 @@ class RevertSignature:
     time_to_rollback_min: int
     impacted_slis: dict[str, dict[str, float]]  # sli → {baseline, peak, unit}
     tags: list[str] = field(default_factory=list)
+    # Tags / impacted SLI names as bitmasks over _BIT_INDEX, for popcount overlap
+    tag_bits: int = field(init=False, repr=False, compare=False)
+    sli_bits: int = field(init=False, repr=False, compare=False)
+    # ── Derived metrics ── computed once from impacted_slis at construction
+    max_spike_ratio: float = field(init=False, repr=False, compare=False)
+    avg_spike_ratio: float = field(init=False, repr=False, compare=False)
+    severity_tier: str = field(init=False, repr=False, compare=False)
+    sli_names: frozenset[str] = field(init=False, repr=False, compare=False)
 
-    # ── Derived metrics ──
-    @property
-    def sli_names(self) -> set[str]:
-        return set(self.impacted_slis.keys())
+    def __post_init__(self) -> None:
+        self.tag_bits = _intern_bits(self.tags)
+        self.sli_bits = _intern_bits(self.impacted_slis)
+        self.sli_names = frozenset(self.impacted_slis)
 
-    @property
-    def max_spike_ratio(self) -> float:
-        """Largest peak/baseline ratio across all impacted SLIs."""
-        ratios = []
+        # Peak/baseline ratios across all impacted SLIs, in one pass
+        max_ratio = float("-inf")
+        sum_ratio = 0.0
         for vals in self.impacted_slis.values():
             baseline = vals.get("baseline", 1) or 1
-            peak = vals.get("peak", baseline)
-            ratios.append(peak / baseline)
-        return max(ratios) if ratios else 1.0
+            ratio = vals.get("peak", baseline) / baseline
+            sum_ratio += ratio
+            if ratio > max_ratio:
+                max_ratio = ratio
+        count = len(self.impacted_slis)
+        self.max_spike_ratio = max_ratio if count else 1.0
+        self.avg_spike_ratio = sum_ratio / count if count else 1.0
+        self.severity_tier = _severity_tier(self.max_spike_ratio)
+
+
+# (minimum max_spike_ratio, tier), highest first
+_SEVERITY_TIERS = ((10, "critical"), (4, "high"), (2, "medium"))
+
+
+def _severity_tier(max_spike_ratio: float) -> str:
+    """Categorise severity based on spike magnitude."""
+    for min_ratio, tier in _SEVERITY_TIERS:
+        if max_spike_ratio >= min_ratio:
+            return tier
+    return "low"
 
-    @property
-    def avg_spike_ratio(self) -> float:
-        ratios = []
-        for vals in self.impacted_slis.values():
-            baseline = vals.get("baseline", 1) or 1
-            peak = vals.get("peak", baseline)
-            ratios.append(peak / baseline)
-        return sum(ratios) / len(ratios) if ratios else 1.0
-
-    @property
-    def severity_tier(self) -> str:
-        """Categorise severity based on spike magnitude."""
-        r = self.max_spike_ratio
-        if r >= 10:
-            return "critical"
-        elif r >= 4:
-            return "high"
-        elif r >= 2:
-            return "medium"
-        return "low"
+
+# Tag / SLI name → bit position. Python ints are unbounded, so the vocabulary
+# can grow past 64 names. setdefault + count keeps indices unique across threads.
+_BIT_INDEX: dict[str, int] = {}
+_next_bit = itertools.count()
+
+
+def _intern_bits(names: Iterable[str]) -> int:
+    """Bitmask for ``names``, assigning bit positions to names seen for the first time."""
+    bits = 0
+    for name in names:
+        bit = _BIT_INDEX.get(name)
+        if bit is None:
+            bit = _BIT_INDEX.setdefault(name, next(_next_bit))
+        bits |= 1 << bit
+    return bits
+
+
+def _known_bits(names: Iterable[str]) -> int:
+    """
+    Bitmask for ``names`` without interning. Names no signature has used
+    can't overlap, and skipping them keeps request input out of the index.
+    """
+    bits = 0
+    for name in names:
+        bit = _BIT_INDEX.get(name)
+        if bit is not None:
+            bits |= 1 << bit
+    return bits
 
 
 def build_signatures(revert_events: list[dict[str, Any]]) -> list[RevertSignature]:
@@ -75,9 +111,16 @@ def build_signatures(revert_events: list[dict[str, Any]]) -> list[RevertSignatur
     Convert raw revert event dicts (from Datadog or YAML) into structured
     RevertSignature objects.
     """
-    signatures = []
+    return list(stream_signatures(revert_events))
+
+
+def stream_signatures(revert_events: Iterable[dict[str, Any]]) -> Iterator[RevertSignature]:
+    """
+    build_signatures as a generator, for large or paginated exports. Feeding
+    it straight into rank_signatures keeps only the top N in memory.
+    """
     for ev in revert_events:
-        sig = RevertSignature(
+        yield RevertSignature(
             revert_id=ev.get("id", "unknown"),
             date=ev.get("date", ""),
             feature=ev.get("feature", ""),
@@ -91,8 +134,6 @@ def build_signatures(revert_events: list[dict[str, Any]]) -> list[RevertSignatur
             impacted_slis=ev.get("impacted_slis", {}),
             tags=ev.get("tags", []),
         )
-        signatures.append(sig)
-    return signatures
 
 
 def compute_similarity(
@@ -101,17 +142,57 @@ def compute_similarity(
     current_platform: str | None,
     current_tags: list[str] | None,
     current_sli_health: dict[str, dict[str, Any]] | None = None,
+    *,
+    current_elevated_slis: Iterable[str] | None = None,
 ) -> float:
     """
     Compute a similarity score (0.0 – 1.0) between a historical revert
     signature and the current release context.
 
+    Callers scoring many signatures against one context can pass
+    ``current_elevated_slis`` (see rank_signatures) to skip rescanning
+    ``current_sli_health`` on every call.
+
     Factors:
         • service match                (0.30 weight)
         • platform match               (0.15 weight)
         • tag overlap                   (0.25 weight)
         • SLI overlap + direction match (0.30 weight)
     """
+    return _similarity(
+        signature,
+        current_service,
+        current_platform,
+        _known_bits(current_tags) if current_tags else 0,
+        _known_bits(_elevated_slis(current_sli_health, current_elevated_slis)),
+    )
+
+
+def _elevated_slis(
+    current_sli_health: dict[str, dict[str, Any]] | None,
+    current_elevated_slis: Iterable[str] | None = None,
+) -> Iterable[str]:
+    """SLIs that are anomalous or more than 20% off baseline right now."""
+    if current_elevated_slis is not None:
+        return current_elevated_slis
+    if not current_sli_health:
+        return ()
+    return [sli for sli, health in current_sli_health.items() if is_sli_elevated(health)]
+
+
+def is_sli_elevated(health: dict[str, Any]) -> bool:
+    """Whether an SLI counts as moved for similarity: anomalous or more than 20% off baseline."""
+    return bool(health.get("is_anomalous")) or health.get("deviation_pct", 0) > 20
+
+
+def _similarity(
+    signature: RevertSignature,
+    current_service: str,
+    current_platform: str | None,
+    cur_tag_bits: int,
+    elevated_sli_bits: int,
+) -> float:
+    """compute_similarity with the current tags / elevated SLIs as bitmasks."""
     score = 0.0
 
     # ── Service match ──
@@ -127,49 +208,99 @@ def compute_similarity(
         elif current_platform == "all":
             score += 0.10
 
-    # ── Tag overlap ──
-    if current_tags:
-        sig_tags = set(signature.tags)
-        cur_tags = set(current_tags)
-        overlap = sig_tags & cur_tags
-        if sig_tags:
-            tag_ratio = len(overlap) / len(sig_tags)
+    # ── Tag overlap ── (no current bits means no overlap to score)
+    if cur_tag_bits:
+        sig_tag_bits = signature.tag_bits
+        if sig_tag_bits:
+            tag_ratio = (sig_tag_bits & cur_tag_bits).bit_count() / sig_tag_bits.bit_count()
             score += 0.25 * tag_ratio
 
     # ── SLI overlap & direction ──
-    if current_sli_health:
-        sig_slis = signature.sli_names
-        current_slis_elevated = {
-            sli for sli, health in current_sli_health.items()
-            if health.get("is_anomalous") or health.get("deviation_pct", 0) > 20
-        }
-        overlap_slis = sig_slis & current_slis_elevated
-        if sig_slis:
-            sli_ratio = len(overlap_slis) / len(sig_slis)
+    if elevated_sli_bits:
+        sig_sli_bits = signature.sli_bits
+        if sig_sli_bits:
+            sli_ratio = (sig_sli_bits & elevated_sli_bits).bit_count() / sig_sli_bits.bit_count()
             score += 0.30 * sli_ratio
 
     return round(min(score, 1.0), 3)
 
 
 def rank_signatures(
-    signatures: list[RevertSignature],
+    signatures: Iterable[RevertSignature],
     current_service: str,
     current_platform: str | None = None,
     current_tags: list[str] | None = None,
     current_sli_health: dict[str, dict[str, Any]] | None = None,
     top_n: int = 5,
+    *,
+    current_elevated_slis: Iterable[str] | None = None,
 ) -> list[tuple[RevertSignature, float]]:
     """
     Rank signatures by similarity to current context, return top N.
     Returns list of (signature, similarity_score) tuples.
+
+    ``signatures`` is consumed once, so it may be a stream_signatures()
+    generator; memory then stays O(top_n) rather than O(corpus).
+
+    ``current_elevated_slis`` (SLIs passing is_sli_elevated) can be given
+    when the caller already classified them, instead of rescanning
+    ``current_sli_health``.
     """
-    scored = []
-    for sig in signatures:
-        sim = compute_similarity(
-            sig, current_service, current_platform, current_tags, current_sli_health
-        )
-        scored.append((sig, sim))
+    # The context is encoded with lookups only, so request input never grows
+    # _BIT_INDEX. Streamed signatures intern their names as they are built, so
+    # while some context names are still unknown, re-encode whenever the index
+    # has grown; once all are known the bits are final.
+    tag_names = tuple(current_tags) if current_tags else ()
+    elevated_names = tuple(_elevated_slis(current_sli_health, current_elevated_slis))
+    context_names = {current_service, *tag_names, *elevated_names}
+    cur_tag_bits = elevated_bits = match_bits = 0
+    encoded_size = -1  # len(_BIT_INDEX) at the last encoding; None once complete
+
+    def encode_context() -> None:
+        nonlocal cur_tag_bits, elevated_bits, match_bits, encoded_size
+        encoded_size = len(_BIT_INDEX)
+        cur_tag_bits = _known_bits(tag_names)
+        elevated_bits = _known_bits(elevated_names)
+        match_bits = cur_tag_bits | _known_bits((current_service,))
+        if context_names.issubset(_BIT_INDEX):
+            encoded_size = None
+
+    # A signature sharing nothing with the context scores exactly 0.0; skip
+    # scoring those. Every platform scores against "all", so nothing is skipped then.
+    match_all = current_platform == "all"
+    platform_hits = (current_platform, "all") if current_platform else ()
+
+    def score(sig: RevertSignature) -> float:
+        if encoded_size is not None and encoded_size != len(_BIT_INDEX):
+            encode_context()
+        if (
+            match_all
+            or sig.service == current_service
+            or sig.platform in platform_hits
+            or sig.tag_bits & match_bits
+            or sig.sli_bits & elevated_bits
+        ):
+            return _similarity(sig, current_service, current_platform, cur_tag_bits, elevated_bits)
+        return 0.0
+
+    scored = ((sig, score(sig)) for sig in signatures)
+    # Same result as a stable descending sort sliced to top_n, without sorting everything
+    return heapq.nlargest(top_n, scored, key=operator.itemgetter(1))
 
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[:top_n]
 
+def rank_signatures_batch(
+    signatures: list[RevertSignature],
+    contexts: list[dict[str, Any]],
+    top_n: int = 5,
+) -> list[list[tuple[RevertSignature, float]]]:
+    """
+    Rank one signature corpus against several release contexts, e.g. every
+    candidate feature in a nightly report. Each context is a dict of
+    rank_signatures keyword arguments (``current_service`` required;
+    ``current_platform``, ``current_tags``, ``current_sli_health``,
+    ``current_elevated_slis`` optional). Returns one ranking per context, in order.
+
+    Signature-side encoding happens once at construction, so each context
+    only pays for encoding itself and scoring.
+    """
+    return [rank_signatures(signatures, top_n=top_n, **context) for context in contexts]
@@ -14,13 +14,30 @@ Then set in .env:
     AGENT_ENV=mock
 """
 
+import functools
+import hashlib
+import itertools
 import json
 import random
 import time
 from datetime import datetime, timedelta, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
 
+try:
+    import orjson
+except ImportError:  # the mock server otherwise needs only the stdlib
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(data) -> bytes:
+        return json.dumps(data).encode()
+
+    _loads = json.loads
+
 # Sample crash data for demo
 SAMPLE_CRASHES = [
     {
@@ -80,13 +97,116 @@ SAMPLE_DEPLOYMENTS = [
 ]
 
 
+# Event-shaped views of the samples, built once and returned by reference.
+# Paired with the service for the tags filter, which isn't part of the payload.
+CRASH_EVENTS = [
+    (crash["service"], {
+        "id": crash["id"],
+        "date_happened": crash["timestamp"],
+        "title": f"Crash in {crash['service']}",
+        "text": crash["error_message"],
+        "tags": [
+            f"service:{crash['service']}",
+            f"platform:{crash['platform']}",
+            f"feature:{crash['feature']}",
+            f"severity:{crash['severity']}",
+        ],
+        "source": "crash",
+    })
+    for crash in SAMPLE_CRASHES
+]
+
+DEPLOY_EVENTS = [
+    (deploy["service"], {
+        "id": deploy["id"],
+        "date_happened": deploy["timestamp"],
+        "title": f"Deployment: {deploy['feature']}",
+        "text": f"Deployed {deploy['feature']} to {deploy['environment']}",
+        "tags": [
+            f"service:{deploy['service']}",
+            f"feature:{deploy['feature']}",
+            f"env:{deploy['environment']}",
+            f"version:{deploy['version']}",
+        ],
+        "source": "deploy",
+    })
+    for deploy in SAMPLE_DEPLOYMENTS
+]
+
+
+def _etag(body):
+    """Strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+@functools.lru_cache(maxsize=64)
+def _events_body(crash_indexes, deploy_indexes):
+    """Serialized events response (and its ETag) for the selected sample events.
+
+    Keyed on which events passed the filters rather than on the query, so the
+    24h window and the crash delay are still evaluated on every request.
+    """
+    body = _dumps({
+        "events": [CRASH_EVENTS[i][1] for i in crash_indexes]
+        + [DEPLOY_EVENTS[i][1] for i in deploy_indexes],
+        "status": "ok",
+    })
+    return body, _etag(body)
+
+
 SERVER_START_TIME = time.time()
 CRASH_DELAY_SECONDS = 0
 
+# Minute-cadence values for the mock time series, keyed by (metric, spiking).
+# Generated once (48h of noise) and cycled, so queries don't draw a random
+# number per point.
+_SERIES_MINUTES = 48 * 60
+
+
+def _noisy_series(level, jitter):
+    return [level + random.uniform(-jitter, jitter) for _ in range(_SERIES_MINUTES)]
+
+
+SERIES_VALUES = {
+    ("crash_rate", True): _noisy_series(0.05, 0.01),
+    ("crash_rate", False): _noisy_series(0.01, 0.01),
+    ("error_rate", True): _noisy_series(0.08, 0.02),
+    ("error_rate", False): _noisy_series(0.02, 0.02),
+}
+
+
+def _pointlist(values, start, end):
+    """[[ms, value], ...] at 1 minute intervals from start to end (seconds, inclusive)."""
+    # Datadog uses milliseconds
+    return [
+        [ts_ms, value]
+        for ts_ms, value in zip(range(start * 1000, end * 1000 + 1, 60_000), itertools.cycle(values))
+    ]
+
 
 class MockDatadogHandler(BaseHTTPRequestHandler):
     """HTTP handler that mimics Datadog API endpoints."""
     
+    # Keep-alive: every response sets Content-Length (send_error does too)
+    protocol_version = "HTTP/1.1"
+    
+    # Endpoint -> handler method. Clients hit the exact paths; the prefixes keep
+    # variants such as a trailing slash routed the way startswith() did.
+    _GET_ROUTES = {
+        "/": "handle_index",
+        "": "handle_index",
+        "/api/v1/query": "handle_metrics_query",
+        "/api/v1/events": "handle_events_list",
+    }
+    _GET_PREFIXES = (
+        ("/api/v1/query", "handle_metrics_query"),
+        ("/api/v1/events", "handle_events_list"),
+    )
+    _POST_ROUTES = {
+        "/api/v2/logs/events/search": "handle_logs_search",
+    }
+    _POST_PREFIXES = tuple(_POST_ROUTES.items())
+    
     def _crashes_active(self):
         return (time.time() - SERVER_START_TIME) >= CRASH_DELAY_SECONDS
 
@@ -124,31 +244,9 @@ class MockDatadogHandler(BaseHTTPRequestHandler):
             # self.send_error(401, "Missing API key")
             # return
         
-        # Root endpoint - Show available endpoints
-        if path == "/" or path == "":
-            self.send_json_response({
-                "status": "ok",
-                "message": "Mock Datadog API Server",
-                "endpoints": {
-                    "GET /api/v1/query": "Query metrics (e.g., crash_rate, error_rate)",
-                    "GET /api/v1/events": "List events (crashes, deployments)",
-                    "POST /api/v2/logs/events/search": "Search logs",
-                },
-                "sample_usage": {
-                    "events": "/api/v1/events?start=0&end=$(date +%s)",
-                    "metrics": "/api/v1/query?query=avg:crash_rate{service:playback-service}&from=0&to=$(date +%s)",
-                }
-            })
-            return
-        
-        # Metrics API - Query metrics
-        elif path.startswith("/api/v1/query"):
-            self.handle_metrics_query(query_params)
-        
-        # Events API - List events
-        elif path.startswith("/api/v1/events"):
-            self.handle_events_list(query_params)
-        
+        handler = self._route(self._GET_ROUTES, self._GET_PREFIXES, path)
+        if handler:
+            getattr(self, handler)(query_params)
         else:
             self.send_error(404, f"Endpoint not found: {path}")
     
@@ -173,13 +271,36 @@ class MockDatadogHandler(BaseHTTPRequestHandler):
             # self.send_error(401, "Missing API key")
             # return
         
-        # Logs API - Search logs
-        if path.startswith("/api/v2/logs/events/search"):
-            self.handle_logs_search()
-        
+        handler = self._route(self._POST_ROUTES, self._POST_PREFIXES, path)
+        if handler:
+            getattr(self, handler)(query_params)
         else:
             self.send_error(404, f"Endpoint not found: {path}")
     
+    @staticmethod
+    def _route(routes, prefixes, path):
+        """Handler name for a path: exact match first, then the prefix fallbacks."""
+        handler = routes.get(path)
+        if handler is None:
+            handler = next((name for prefix, name in prefixes if path.startswith(prefix)), None)
+        return handler
+    
+    def handle_index(self, query_params):
+        """Root endpoint - Show available endpoints."""
+        self.send_json_response({
+            "status": "ok",
+            "message": "Mock Datadog API Server",
+            "endpoints": {
+                "GET /api/v1/query": "Query metrics (e.g., crash_rate, error_rate)",
+                "GET /api/v1/events": "List events (crashes, deployments)",
+                "POST /api/v2/logs/events/search": "Search logs",
+            },
+            "sample_usage": {
+                "events": "/api/v1/events?start=0&end=$(date +%s)",
+                "metrics": "/api/v1/query?query=avg:crash_rate{service:playback-service}&from=0&to=$(date +%s)",
+            }
+        })
+    
     def handle_metrics_query(self, query_params):
         """Handle Metrics API query."""
         query = query_params.get("query", [""])[0]
@@ -193,17 +314,8 @@ class MockDatadogHandler(BaseHTTPRequestHandler):
         if "crash_rate" in query:
             # Return crash rate data
             # Simulate: baseline 0.01 (1%), current spike to 0.05 (5%)
-            baseline = 0.01
-            current = 0.05 if random.random() > 0.3 else baseline  # 70% chance of spike
-            
-            # Generate time series points
-            points = []
-            current_time = start
-            while current_time <= end:
-                # Add some variation
-                value = current + random.uniform(-0.01, 0.01)
-                points.append([current_time * 1000, value])  # Datadog uses milliseconds
-                current_time += 60  # 1 minute intervals
+            spiking = random.random() > 0.3  # 70% chance of spike
+            points = _pointlist(SERIES_VALUES["crash_rate", spiking], start, end)
             
             response = {
                 "status": "ok",
@@ -222,15 +334,8 @@ class MockDatadogHandler(BaseHTTPRequestHandler):
         
         elif "error_rate" in query:
             # Similar for error_rate
-            baseline = 0.02
-            current = 0.08 if random.random() > 0.4 else baseline
-            
-            points = []
-            current_time = start
-            while current_time <= end:
-                value = current + random.uniform(-0.02, 0.02)
-                points.append([current_time * 1000, value])
-                current_time += 60
+            spiking = random.random() > 0.4
+            points = _pointlist(SERIES_VALUES["error_rate", spiking], start, end)
             
             response = {
                 "status": "ok",
@@ -264,80 +369,41 @@ class MockDatadogHandler(BaseHTTPRequestHandler):
         tags = query_params.get("tags", [""])[0]
         sources = query_params.get("sources", [""])[0]
         
-        events = []
-        
         if not self._crashes_active():
-            self.send_json_response({"events": [], "status": "ok"})
+            self.send_body(*_events_body((), ()))
             return
 
         service_filter = None
         if tags and "service:" in tags:
             service_filter = tags.split("service:")[1].split(",")[0].strip()
         
-        # Filter crashes based on time window
-        for crash in SAMPLE_CRASHES:
-            # For demo, always include crashes if within time window (or if time window is very wide)
-            # Real implementation would check: start <= crash["timestamp"] <= end
-            # But for demo, we'll return recent crashes regardless
-            crash_time = crash["timestamp"]
-            current_time = int(time.time())
-            
-            # Include if crash is within last 24 hours OR if no time filter specified
-            if start == 0 or (current_time - crash_time) < (24 * 3600):
-                # Check service filter if provided
-                if not service_filter or crash["service"] == service_filter:
-                    events.append({
-                        "id": crash["id"],
-                        "date_happened": crash["timestamp"],
-                        "title": f"Crash in {crash['service']}",
-                        "text": crash["error_message"],
-                        "tags": [
-                            f"service:{crash['service']}",
-                            f"platform:{crash['platform']}",
-                            f"feature:{crash['feature']}",
-                            f"severity:{crash['severity']}",
-                        ],
-                        "source": "crash",
-                    })
+        # For demo, include events from the last 24 hours (or all if no time filter)
+        # Real implementation would check: start <= date_happened <= end
+        current_time = int(time.time())
+
+        def wanted(service, event):
+            return (
+                (start == 0 or (current_time - event["date_happened"]) < (24 * 3600))
+                and (not service_filter or service == service_filter)
+            )
+
+        crash_indexes = tuple(i for i, (service, event) in enumerate(CRASH_EVENTS) if wanted(service, event))
+        deploy_indexes = ()
         
         # Add deployment events
         if "deploy" in sources or "deployment" in sources or not sources:
-            for deploy in SAMPLE_DEPLOYMENTS:
-                deploy_time = deploy["timestamp"]
-                current_time = int(time.time())
-                
-                # Include if deployment is within last 24 hours OR if no time filter
-                if start == 0 or (current_time - deploy_time) < (24 * 3600):
-                    if not service_filter or deploy["service"] == service_filter:
-                        events.append({
-                            "id": deploy["id"],
-                            "date_happened": deploy["timestamp"],
-                            "title": f"Deployment: {deploy['feature']}",
-                            "text": f"Deployed {deploy['feature']} to {deploy['environment']}",
-                            "tags": [
-                                f"service:{deploy['service']}",
-                                f"feature:{deploy['feature']}",
-                                f"env:{deploy['environment']}",
-                                f"version:{deploy['version']}",
-                            ],
-                            "source": "deploy",
-                        })
-        
-        response = {
-            "events": events,
-            "status": "ok"
-        }
+            deploy_indexes = tuple(i for i, (service, event) in enumerate(DEPLOY_EVENTS) if wanted(service, event))
         
-        self.send_json_response(response)
+        self.send_body(*_events_body(crash_indexes, deploy_indexes))
     
-    def handle_logs_search(self):
+    def handle_logs_search(self, query_params):
         """Handle Logs API search (simplified)."""
         # Read request body
         content_length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(content_length)
         
         try:
-            request_data = json.loads(body.decode())
+            request_data = _loads(body)
             filter_query = request_data.get("filter", {}).get("query", "")
             
             # Return sample log entries that match crash patterns
@@ -369,11 +435,25 @@ class MockDatadogHandler(BaseHTTPRequestHandler):
     
     def send_json_response(self, data):
         """Send JSON response."""
+        body = _dumps(data)
+        self.send_body(body, _etag(body))
+    
+    def send_body(self, body, etag):
+        """Send a serialized JSON body, or 304 if the client already has this ETag."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            return
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))  # lets HTTP/1.1 clients keep the connection
+        self.send_header("ETag", etag)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
     
     def log_message(self, format, *args):
         """Override to reduce logging noise."""
@@ -383,7 +463,10 @@ class MockDatadogHandler(BaseHTTPRequestHandler):
 def run_server(port=8080):
     """Run the mock Datadog server."""
     server_address = ("", port)
-    httpd = HTTPServer(server_address, MockDatadogHandler)
+    # One thread per request so a slow client doesn't block the rest;
+    # handler threads are daemonic, so Ctrl+C still exits promptly
+    httpd = ThreadingHTTPServer(server_address, MockDatadogHandler)
+    httpd.daemon_threads = True
     print(f"Mock Datadog API Server running on http://localhost:{port}")
     if CRASH_DELAY_SECONDS > 0:
         print(f"   Crash delay: {CRASH_DELAY_SECONDS}s (crashes will appear after delay)")
@@ -19,15 +19,17 @@ Usage:
 """
 
 import argparse
-import json
+import gzip
 import logging
 import os
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom.minidom import parseString
+from xml.etree.ElementTree import Element, SubElement, indent, tostring
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
@@ -38,22 +40,32 @@ logger = logging.getLogger("push-to-datadog")
 
 DD_API_KEY = os.getenv("DD_API_KEY", "")
 DD_SITE = os.getenv("DD_SITE", "datadoghq.com")
+# Both intake endpoints accept gzip bodies; the repetitive tag fields compress well
+GZIP_LEVEL = 6
+# Logs intake limits are 1000 events / 5MB uncompressed per request; keep headroom
+LOGS_MAX_BATCH_EVENTS = 1000
+LOGS_MAX_BATCH_BYTES = 4_500_000
+# Log batches upload concurrently, up to this many in flight
+LOGS_UPLOAD_WORKERS = 4
 
 PRIORITY_MAP = {1: "P0-Critical", 2: "P1-High", 3: "P2-Medium", 4: "P3-Low"}
 TYPE_MAP = {1: "Smoke", 2: "Functional", 3: "Regression", 4: "Navigation", 5: "E2E", 6: "Edge", 7: "Negative"}
 
 
 def load_test_cases(path: str) -> dict:
-    with open(path) as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 # ---------------------------------------------------------------------------
 # CI Test Visibility — JUnit XML
 # ---------------------------------------------------------------------------
 
-def generate_junit_xml(data: dict, output_path: str) -> str:
-    """Convert test case data to JUnit XML format for CI Test Visibility."""
+def generate_junit_xml(data: dict, output_path: str) -> bytes:
+    """
+    Convert test case data to JUnit XML format for CI Test Visibility.
+    Writes it to ``output_path`` and returns the XML bytes for upload.
+    """
     test_cases = data.get("test_cases", [])
     platform = data.get("platform", "web")
     screenshot_dir = data.get("screenshot_directory", "")
@@ -99,25 +111,28 @@ def generate_junit_xml(data: dict, output_path: str) -> str:
         ]:
             SubElement(props, "property", name=k, value=v)
 
-        detail_lines = []
-        for i, step in enumerate(steps, 1):
-            line = f"Step {i}: {step.get('content', '')} → Expected: {step.get('expected', '')}"
-            if step.get("attachment"):
-                line += f" [Screenshot: {os.path.basename(step['attachment'])}]"
-            detail_lines.append(line)
-        SubElement(testcase, "system-out").text = "\n".join(detail_lines)
+        # Step-less cases get no (empty) system-out element
+        if step_count:
+            detail_lines = []
+            for i, step in enumerate(steps, 1):
+                line = f"Step {i}: {step.get('content', '')} → Expected: {step.get('expected', '')}"
+                if step.get("attachment"):
+                    line += f" [Screenshot: {os.path.basename(step['attachment'])}]"
+                detail_lines.append(line)
+            SubElement(testcase, "system-out").text = "\n".join(detail_lines)
 
-    raw_xml = tostring(testsuites, encoding="unicode")
-    pretty = parseString(raw_xml).toprettyxml(indent="  ", encoding="UTF-8").decode()
+    # Indent in place; no minidom re-parse just for pretty-printing
+    indent(testsuites, space="  ")
+    xml_content = tostring(testsuites, encoding="UTF-8", xml_declaration=True)
 
-    with open(output_path, "w") as f:
-        f.write(pretty)
+    with open(output_path, "wb") as f:
+        f.write(xml_content)
 
     logger.info("JUnit XML written to %s (%d test cases)", output_path, len(test_cases))
-    return output_path
+    return xml_content
 
 
-def upload_junit_to_datadog(xml_path: str, service: str = "project-skynet"):
+def upload_junit_to_datadog(xml_content: bytes, service: str = "project-skynet"):
     """Upload JUnit XML to Datadog CI Test Visibility via the intake API."""
     if not DD_API_KEY:
         logger.error("DD_API_KEY not set — cannot upload to CI Test Visibility")
@@ -125,9 +140,6 @@ def upload_junit_to_datadog(xml_path: str, service: str = "project-skynet"):
 
     url = f"https://api.{DD_SITE}/api/v2/ci/tests/junit"
 
-    with open(xml_path, "rb") as f:
-        xml_content = f.read()
-
     tags = [
         "service:project-skynet",
         "env:hackathon",
@@ -141,13 +153,14 @@ def upload_junit_to_datadog(xml_path: str, service: str = "project-skynet"):
             headers={
                 "DD-API-KEY": DD_API_KEY,
                 "Content-Type": "text/xml",
+                "Content-Encoding": "gzip",
             },
             params={
                 "service": service,
                 "env": "hackathon",
                 "tags": ",".join(tags),
             },
-            data=xml_content,
+            data=gzip.compress(xml_content, compresslevel=GZIP_LEVEL),
             timeout=30,
         )
 
@@ -181,14 +194,22 @@ def push_logs_to_datadog(data: dict):
 
     logs = []
 
-    summary_log = {
+    # Fields shared by every event; entries override ddtags and message in place,
+    # so the key order matches the original per-entry literals
+    base_tags = f"env:hackathon,service:project-skynet,platform:{platform}"
+    base_entry = {
         "ddsource": "project-skynet",
-        "ddtags": f"env:hackathon,service:project-skynet,platform:{platform}",
+        "ddtags": base_tags,
         "hostname": "local",
         "service": "project-skynet",
         "status": "info",
-        "message": f"QA Test Suite Generated — {len(test_cases)} test cases ({platform})",
+        "message": "",
         "timestamp": now,
+    }
+
+    summary_log = {
+        **base_entry,
+        "message": f"QA Test Suite Generated — {len(test_cases)} test cases ({platform})",
         "test_suite": {
             "total_cases": len(test_cases),
             "platform": platform,
@@ -199,8 +220,8 @@ def push_logs_to_datadog(data: dict):
         },
     }
 
-    priority_counts = {}
-    type_counts = {}
+    priority_counts = Counter()
+    type_counts = Counter()
 
     for tc in test_cases:
         tc_id = tc.get("custom_id", "TC-???")
@@ -210,21 +231,13 @@ def push_logs_to_datadog(data: dict):
         steps = tc.get("custom_steps_separated", [])
         screenshot_count = sum(1 for s in steps if s.get("attachment"))
 
-        priority_counts[priority] = priority_counts.get(priority, 0) + 1
-        type_counts[test_type] = type_counts.get(test_type, 0) + 1
+        priority_counts[priority] += 1
+        type_counts[test_type] += 1
 
         log_entry = {
-            "ddsource": "project-skynet",
-            "ddtags": (
-                f"env:hackathon,service:project-skynet,platform:{platform},"
-                f"test.priority:{priority},test.type:{test_type},"
-                f"test.id:{tc_id}"
-            ),
-            "hostname": "local",
-            "service": "project-skynet",
-            "status": "info",
+            **base_entry,
+            "ddtags": f"{base_tags},test.priority:{priority},test.type:{test_type},test.id:{tc_id}",
             "message": f"Test Case {tc_id}: {title}",
-            "timestamp": now,
             "test_case": {
                 "id": tc_id,
                 "title": title,
@@ -242,46 +255,89 @@ def push_logs_to_datadog(data: dict):
                         "has_screenshot": bool(s.get("attachment")),
                     }
                     for s in steps
-                ],
+                ] if steps else (),  # orjson writes the shared empty tuple as []
             },
         }
         logs.append(log_entry)
 
-    summary_log["test_suite"]["priority_breakdown"] = priority_counts
-    summary_log["test_suite"]["type_breakdown"] = type_counts
+    summary_log["test_suite"]["priority_breakdown"] = dict(priority_counts)
+    summary_log["test_suite"]["type_breakdown"] = dict(type_counts)
     logs.insert(0, summary_log)
 
     intake_url = f"https://http-intake.logs.{DD_SITE}/api/v2/logs"
 
-    try:
-        resp = requests.post(
-            intake_url,
-            headers={
-                "DD-API-KEY": DD_API_KEY,
-                "Content-Type": "application/json",
-            },
-            json=logs,
-            timeout=30,
-        )
+    batches = list(_log_batches(logs))
+    headers = {
+        "DD-API-KEY": DD_API_KEY,
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    }
 
-        if resp.status_code in (200, 202):
-            logger.info(
-                "Pushed %d log events to Datadog Logs (HTTP %d)",
-                len(logs), resp.status_code,
+    try:
+        # Batches are independent; overlap their round-trips on one pooled session
+        with requests.Session() as session, ThreadPoolExecutor(
+            max_workers=min(LOGS_UPLOAD_WORKERS, len(batches))
+        ) as executor:
+            responses = list(executor.map(
+                lambda batch: session.post(
+                    intake_url,
+                    headers=headers,
+                    data=gzip.compress(batch[0], compresslevel=GZIP_LEVEL),
+                    timeout=30,
+                ),
+                batches,
+            ))
+
+        failed = [
+            (i, resp) for i, resp in enumerate(responses, 1)
+            if resp.status_code not in (200, 202)
+        ]
+        for i, resp in failed:
+            logger.warning(
+                "Logs push batch %d returned HTTP %d: %s",
+                i, resp.status_code, resp.text[:300],
             )
-            logger.info(
-                "View at: https://app.%s/logs?query=service:project-skynet", DD_SITE,
+        if failed:
+            logger.warning(
+                "%d of %d log batches were rejected", len(failed), len(batches),
             )
-            return True
-        else:
-            logger.warning("Logs push returned HTTP %d: %s", resp.status_code, resp.text[:300])
             return False
 
+        logger.info(
+            "Pushed %d log events to Datadog Logs in %d batch(es)",
+            len(logs), len(batches),
+        )
+        logger.info(
+            "View at: https://app.%s/logs?query=service:project-skynet", DD_SITE,
+        )
+        return True
+
     except Exception as e:
         logger.error("Logs push failed: %s", e)
         return False
 
 
+def _log_batches(logs: list[dict]):
+    """
+    Yield (JSON array bytes, event count) batches within the Logs intake
+    limits. Each event is encoded once and the array is joined from those.
+    """
+    batch: list[bytes] = []
+    batch_bytes = 2  # the enclosing []
+    for event in logs:
+        encoded = orjson.dumps(event)
+        if batch and (
+            len(batch) >= LOGS_MAX_BATCH_EVENTS
+            or batch_bytes + len(encoded) + 1 > LOGS_MAX_BATCH_BYTES
+        ):
+            yield b"[" + b",".join(batch) + b"]", len(batch)
+            batch, batch_bytes = [], 2
+        batch.append(encoded)
+        batch_bytes += len(encoded) + 1
+    if batch:
+        yield b"[" + b",".join(batch) + b"]", len(batch)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -319,8 +375,8 @@ def main():
 
     if do_ci:
         logger.info("--- CI Test Visibility ---")
-        xml_path = generate_junit_xml(data, args.junit_output)
-        upload_junit_to_datadog(xml_path)
+        xml_content = generate_junit_xml(data, args.junit_output)
+        upload_junit_to_datadog(xml_content)
 
     if do_logs:
         logger.info("--- Structured Logs ---")
@@ -12,7 +12,9 @@ Endpoints:
 
 from __future__ import annotations
 
+import itertools
 import json
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -150,8 +152,8 @@ async def get_agent_telemetry():
     return {
         "total_runs": len(telem["runs"]),
         "total_dd_queries": len(telem["dd_queries"]),
-        "runs": telem["runs"][-20:],  # Last 20
-        "dd_queries": telem["dd_queries"][-50:],  # Last 50
+        "runs": _tail(telem["runs"], 20),
+        "dd_queries": _tail(telem["dd_queries"], 50),
         "summary": {
             "avg_latency_ms": (
                 round(sum(r["latency_ms"] for r in telem["runs"]) / len(telem["runs"]), 1)
@@ -167,6 +169,11 @@ async def get_agent_telemetry():
     }
 
 
+def _tail(records: deque[dict], n: int) -> list[dict]:
+    """Last ``n`` records, oldest first, without copying the whole deque."""
+    return list(itertools.islice(reversed(records), n))[::-1]
+
+
 @app.get("/api/services")
 async def list_services():
     """List available services from demo data."""